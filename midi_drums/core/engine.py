@@ -1,39 +1,82 @@
 """Main drum generation engine and composition system."""
 
 import logging
+from itertools import compress
 from pathlib import Path
 
+import numpy as np
+
 from midi_drums.engines.midi_engine import MIDIEngine
 from midi_drums.models.kit import DrumKit
-from midi_drums.models.pattern import Pattern
+from midi_drums.models.pattern import (
+    TICKS_PER_BEAT,
+    Beat,
+    DrumInstrument,
+    Pattern,
+)
 from midi_drums.models.song import GenerationParameters, Section, Song
 from midi_drums.plugins.base import PluginManager
+from midi_drums.utils.cache import get_or_create
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of per-kit MIDI engines kept for export_pattern_midi
+_ENGINE_POOL_SIZE = 8
+
+# MIDI note values of the plain hi-hat instruments (CLOSED_HH, OPEN_HH, ...)
+_HIHAT_VALUES = np.array(
+    [inst.value for inst in DrumInstrument if inst.name.endswith("HH")],
+    dtype=np.int16,
+)
+
+
+def _generation_parameters(genre: str, **kwargs) -> GenerationParameters:
+    """Build GenerationParameters, sharing instances where it is safe.
+
+    Parameter sets without ``custom_parameters`` are interned, so repeated
+    calls with the same genre, style and knobs reuse one instance. A
+    caller-supplied ``custom_parameters`` dict keeps its own mutable copy.
+    """
+    if kwargs.get("custom_parameters") is None:
+        kwargs.pop("custom_parameters", None)
+        return GenerationParameters.interned(genre, **kwargs)
+    return GenerationParameters(genre=genre, **kwargs)
+
 
 class DrumGenerator:
     """Main drum generation engine."""
 
     def __init__(self, config_path: Path | None = None):
-        """Initialize drum generator with optional configuration."""
-        self.plugin_manager = PluginManager()
+        """Initialize drum generator with optional configuration.
+
+        Plugins are discovered lazily, the first time ``plugin_manager`` is
+        accessed, so MIDI export and kit helpers don't pay for discovery.
+        """
+        self._plugin_manager = PluginManager()
+        self._plugins_loaded = False
         self.drum_kit = DrumKit.create_ezdrummer3_kit()
         self.midi_engine = MIDIEngine(self.drum_kit)
+        self._engine_pool: dict[int, MIDIEngine] = {}
+        self._rng = np.random.default_rng()
 
-        # Load plugins
-        self._load_plugins()
+    @property
+    def plugin_manager(self) -> PluginManager:
+        """Plugin manager, loading all available plugins on first access."""
+        if not self._plugins_loaded:
+            self._plugins_loaded = True
+            self._load_plugins()
+        return self._plugin_manager
 
     def _load_plugins(self) -> None:
         """Load all available plugins."""
         try:
-            self.plugin_manager.discover_plugins()
+            self._plugin_manager.discover_plugins()
             logger.info(
-                f"Loaded genres: {self.plugin_manager.get_available_genres()}"
+                f"Loaded genres: {self._plugin_manager.get_available_genres()}"
             )
             logger.info(
                 f"Loaded drummers: "
-                f"{self.plugin_manager.get_available_drummers()}"
+                f"{self._plugin_manager.get_available_drummers()}"
             )
         except Exception as e:
             logger.error(f"Failed to load plugins: {e}")
@@ -64,11 +107,11 @@ class DrumGenerator:
         """
         # Update MIDI engine if new drum kit provided
         if drum_kit:
-            self.midi_engine = MIDIEngine(drum_kit)
-            self.drum_kit = drum_kit
+            self.set_drum_kit(drum_kit)
 
-        # Create generation parameters
-        params = GenerationParameters(genre=genre, style=style, **kwargs)
+        # Create generation parameters; sets without custom parameters
+        # are shared between calls
+        params = _generation_parameters(genre, style=style, **kwargs)
 
         # Use default structure if none provided
         if structure is None:
@@ -142,7 +185,7 @@ class DrumGenerator:
             )
         """
         # Create parameters
-        params = GenerationParameters(genre=genre, **kwargs)
+        params = _generation_parameters(genre, **kwargs)
 
         # Generate base pattern
         pattern = self.plugin_manager.generate_pattern(genre, section, params)
@@ -210,7 +253,7 @@ class DrumGenerator:
         # Use provided drum kit or current one
         engine = self.midi_engine
         if drum_kit:
-            engine = MIDIEngine(drum_kit)
+            engine = self._engine_for_kit(drum_kit)
 
         engine.save_pattern_midi(pattern, output_path, tempo)
         logger.info(f"Exported pattern MIDI to: {output_path}")
@@ -255,6 +298,8 @@ class DrumGenerator:
 
     def set_drum_kit(self, kit: DrumKit) -> None:
         """Set the drum kit configuration."""
+        if kit is self.drum_kit:
+            return
         self.drum_kit = kit
         self.midi_engine = MIDIEngine(kit)
 
@@ -275,6 +320,20 @@ class DrumGenerator:
             return DrumKit.create_ezdrummer3_kit()
 
     # Private helper methods
+    def _engine_for_kit(self, drum_kit: DrumKit) -> MIDIEngine:
+        """Return a MIDIEngine for ``drum_kit``, reusing pooled engines.
+
+        Engines are keyed by kit identity; see ``get_or_create``.
+        """
+        if drum_kit is self.drum_kit:
+            return self.midi_engine
+        return get_or_create(
+            self._engine_pool,
+            id(drum_kit),
+            lambda: MIDIEngine(drum_kit),
+            _ENGINE_POOL_SIZE,
+        )
+
     def _generate_variations(
         self, base_pattern: Pattern, params: GenerationParameters
     ) -> list:
@@ -289,14 +348,12 @@ class DrumGenerator:
             simplified.name = f"{base_pattern.name}_simple"
 
             # Remove some hi-hat hits for variation
-            simplified.beats = [
-                beat
-                for beat in simplified.beats
-                if not (
-                    beat.instrument.name.endswith("HH")
-                    and beat.position % 0.5 != 0
-                )
-            ]
+            beats = simplified.arrays()
+            keep = ~(
+                np.isin(beats.instruments, _HIHAT_VALUES)
+                & (beats.ticks() % (TICKS_PER_BEAT // 2) != 0)
+            )
+            simplified.beats = list(compress(simplified.beats, keep.tolist()))
 
             variations.append(PatternVariation(simplified, 0.3))
 
@@ -317,23 +374,32 @@ class DrumGenerator:
         extended_pattern = pattern.copy()
         extended_pattern.name = f"{pattern.name}_{bars}bars"
 
-        original_beats = pattern.beats.copy()
+        # Only read from here on; new beats go to extended_pattern's own list
+        original_beats = pattern.beats
         beats_per_bar = pattern.time_signature.beats_per_bar
 
+        # Draw the per-beat velocity variation for every extra bar at once
+        base_velocities = np.fromiter(
+            (beat.velocity for beat in original_beats),
+            dtype=np.int16,
+            count=len(original_beats),
+        )
+        jitter = self._rng.integers(
+            -5, 6, size=(bars - 1, len(original_beats)), dtype=np.int16
+        )
+        velocities = np.clip(base_velocities + jitter, 1, 127).tolist()
+
         # Repeat pattern for additional bars with slight variations
         for bar in range(1, bars):
             bar_offset = bar * beats_per_bar
-            for beat in original_beats:
-                import random
-
-                from midi_drums.models.pattern import Beat
-
+            bar_velocities = velocities[bar - 1]
+            for beat, velocity in zip(
+                original_beats, bar_velocities, strict=True
+            ):
                 new_beat = Beat(
                     position=beat.position + bar_offset,
                     instrument=beat.instrument,
-                    velocity=max(
-                        1, min(127, beat.velocity + random.randint(-5, 5))
-                    ),  # Slight variation with clamping
+                    velocity=velocity,
                     duration=beat.duration,
                     ghost_note=beat.ghost_note,
                     accent=beat.accent,
@@ -1,10 +1,14 @@
 """MIDI file generation engine."""
 
 import copy
+import io
 from pathlib import Path
 
+import numpy as np
+
 try:
     from midiutil import MIDIFile
+    from midiutil.MidiFile import NoteOff, NoteOn
 except ImportError:
     raise ImportError(
         "midiutil library not found. Install with 'pip install midiutil'."
@@ -12,7 +16,7 @@ except ImportError:
 
 from midi_drums.models.kit import DrumKit
 from midi_drums.models.pattern import Pattern
-from midi_drums.models.song import Song
+from midi_drums.models.song import RandomSource, Song
 
 
 class MIDIEngine:
@@ -22,6 +26,79 @@ class MIDIEngine:
         """Initialize MIDI engine with optional drum kit configuration."""
         self.drum_kit = drum_kit or DrumKit.create_ezdrummer3_kit()
 
+    def _pitch_table(self) -> np.ndarray:
+        """Map DrumInstrument values to MIDI notes for the current kit.
+
+        Index the returned array with ``BeatArrays.instruments`` to resolve
+        every beat's pitch at once; it mirrors ``DrumKit.get_midi_note``.
+        """
+        table = np.arange(128, dtype=np.int16)
+        for instrument, note in self.drum_kit.custom_mappings.items():
+            table[instrument.value] = note
+        return table
+
+    @staticmethod
+    def _bulk_add_notes(
+        midi: MIDIFile,
+        track: int,
+        channel: int,
+        times,
+        pitches,
+        durations,
+        velocities,
+    ) -> None:
+        """Add many notes to a track in one pass.
+
+        Equivalent to calling ``midi.addNote`` for each note in order, but
+        converts beat times to ticks in one vectorized step and extends the
+        track's event list once instead of going through midiutil's
+        per-call wrapper. Inputs are parallel sequences or NumPy arrays of
+        already valid values (pitches and velocities 0-127).
+        """
+        count = len(pitches)
+        if count == 0:
+            return
+
+        tpq = midi.ticks_per_quarternote
+        on_ticks = (np.asarray(times, dtype=np.float64) * tpq).astype(np.int64)
+        duration_ticks = (np.asarray(durations, dtype=np.float64) * tpq).astype(
+            np.int64
+        )
+        off_ticks = on_ticks + duration_ticks
+
+        if midi.header.numeric_format == 1:
+            track += 1  # tracks[0] is midiutil's tempo track
+
+        first_order = midi.event_counter
+        events = []
+        for order, pitch, on_tick, off_tick, duration, velocity in zip(
+            range(first_order, first_order + count),
+            np.asarray(pitches).tolist(),
+            on_ticks.tolist(),
+            off_ticks.tolist(),
+            duration_ticks.tolist(),
+            np.asarray(velocities).tolist(),
+            strict=True,
+        ):
+            events.append(
+                NoteOn(
+                    channel,
+                    pitch,
+                    on_tick,
+                    duration,
+                    velocity,
+                    insertion_order=order,
+                )
+            )
+            events.append(
+                NoteOff(
+                    channel, pitch, off_tick, velocity, insertion_order=order
+                )
+            )
+
+        midi.tracks[track].eventList.extend(events)
+        midi.event_counter += count
+
     def pattern_to_midi(self, pattern: Pattern, tempo: int = 120) -> MIDIFile:
         """Convert a single pattern to a MIDI file.
 
@@ -35,31 +112,40 @@ class MIDIEngine:
         midi.addTempo(track, 0, tempo)
 
         # Sort beats by position, then by instrument for consistent ordering
-        sorted_beats = sorted(
-            pattern.beats, key=lambda b: (b.position, b.instrument.value)
-        )
+        beats = pattern.arrays()
+        order = np.lexsort((beats.instruments, beats.positions))
+        pitches = self._pitch_table()[beats.instruments[order]]
+
+        # Cap duration to prevent overlap with next note
+        # Use minimum of beat.duration or a safe short duration
+        safe_durations = np.minimum(beats.durations[order], 0.2)
 
         # Add pattern beats with overlap prevention
-        for beat in sorted_beats:
-            midi_note = self.drum_kit.get_midi_note(beat.instrument)
-
-            # Cap duration to prevent overlap with next note
-            # Use minimum of beat.duration or a safe short duration
-            safe_duration = min(beat.duration, 0.2)
-
-            midi.addNote(
-                track=track,
-                channel=channel,
-                pitch=midi_note,
-                time=beat.position,
-                duration=safe_duration,
-                volume=beat.velocity,
-            )
+        self._bulk_add_notes(
+            midi,
+            track,
+            channel,
+            beats.positions[order],
+            pitches,
+            safe_durations,
+            beats.velocities[order],
+        )
 
         return midi
 
-    def song_to_midi(self, song: Song) -> MIDIFile:
-        """Convert a complete song to a MIDI file."""
+    def song_to_midi(
+        self, song: Song, rng: RandomSource | None = None
+    ) -> MIDIFile:
+        """Convert a complete song to a MIDI file.
+
+        Args:
+            song: Song to render
+            rng: Generator for variation and fill decisions; defaults to the
+                shared one in ``midi_drums.models.song``
+
+        Returns:
+            MIDIFile ready to write
+        """
         midi = MIDIFile(1)  # 1 track
         track = 0
         channel = self.drum_kit.channel
@@ -81,6 +167,7 @@ class MIDIEngine:
                 current_bar,
                 song,
                 added_note_ticks,
+                rng,
             )
             current_bar += section.bars
 
@@ -95,6 +182,7 @@ class MIDIEngine:
         current_bar: int,
         song: Song,
         added_note_ticks: set[tuple[int, int]] | None = None,
+        rng: RandomSource | None = None,
     ) -> None:
         """Add a song section to the MIDI file."""
         # midiutil uses int(time * ticks_per_quarter) to convert beat times to
@@ -112,19 +200,31 @@ class MIDIEngine:
 
         beats_per_bar = song.time_signature.beats_per_bar
 
+        # Notes are collected for the whole section and handed to midiutil
+        # in one batch, in the same order they would have been added.
+        times: list[float] = []
+        pitches: list[int] = []
+        durations: list[float] = []
+        velocities: list[int] = []
+
+        # Fills are only rendered on the section's last bar, so decide that
+        # bar once up front instead of rolling for every bar.
+        last_bar = section.bars - 1
+        fill_schedule = {}
+        if song.global_parameters:
+            fill_schedule = section.fill_schedule(
+                song.global_parameters.fill_frequency, (last_bar,), rng
+            )
+
+        # Variations are likewise decided for every bar in one pass
+        pattern_schedule = section.pattern_schedule(rng=rng)
+
         for bar_num in range(section.bars):
             absolute_bar = current_bar + bar_num
             bar_start_time = absolute_bar * beats_per_bar
 
             # Get the effective pattern for this bar (considering variations)
-            pattern = section.get_effective_pattern(bar_num)
-
-            # Check if we should add a fill
-            fill = None
-            if song.global_parameters:
-                fill = section.should_add_fill(
-                    bar_num, song.global_parameters.fill_frequency
-                )
+            pattern = pattern_schedule[bar_num]
 
             # Detect the natural bar-span of THIS bar's pattern so multi-bar
             # patterns (e.g. assigned via assign_pattern_to_section) are tiled
@@ -181,19 +281,14 @@ class MIDIEngine:
                     continue
                 added_note_ticks.add(note_key)
 
-                midi.addNote(
-                    track=track,
-                    channel=channel,
-                    pitch=midi_note,
-                    time=absolute_time,
-                    duration=safe_duration,
-                    volume=beat.velocity,
-                )
+                times.append(absolute_time)
+                pitches.append(midi_note)
+                durations.append(safe_duration)
+                velocities.append(beat.velocity)
 
             # Add fill if present (replaces last part of the bar)
-            if (
-                fill and bar_num == section.bars - 1
-            ):  # Add fill at end of section
+            fill = fill_schedule.get(bar_num)
+            if fill:  # Add fill at end of section
                 fill_start_time = bar_start_time + (
                     song.time_signature.beats_per_bar - 1.0
                 )
@@ -209,28 +304,37 @@ class MIDIEngine:
                             continue
                         added_note_ticks.add(note_key)
 
-                        midi.addNote(
-                            track=track,
-                            channel=channel,
-                            pitch=midi_note,
-                            time=absolute_time,
-                            duration=safe_duration,
-                            volume=beat.velocity,
-                        )
+                        times.append(absolute_time)
+                        pitches.append(midi_note)
+                        durations.append(safe_duration)
+                        velocities.append(beat.velocity)
+
+        self._bulk_add_notes(
+            midi, track, channel, times, pitches, durations, velocities
+        )
 
     def save_pattern_midi(
         self, pattern: Pattern, output_path: Path, tempo: int = 120
     ) -> None:
         """Save a pattern as a MIDI file."""
         midi = self.pattern_to_midi(pattern, tempo)
-        with open(output_path, "wb") as f:
-            midi.writeFile(f)
+        self._write_midi_file(midi, output_path)
 
     def save_song_midi(self, song: Song, output_path: Path) -> None:
         """Save a complete song as a MIDI file."""
         midi = self.song_to_midi(song)
-        with open(output_path, "wb") as f:
-            midi.writeFile(f)
+        self._write_midi_file(midi, output_path)
+
+    @staticmethod
+    def _write_midi_file(midi: MIDIFile, output_path: Path) -> None:
+        """Serialize a MIDI file in memory and write it with one call.
+
+        midiutil emits many small writes while serializing; buffering them
+        in memory turns the export into a single write to disk.
+        """
+        buffer = io.BytesIO()
+        midi.writeFile(buffer)
+        Path(output_path).write_bytes(buffer.getvalue())
 
     def export_patterns_to_separate_files(
         self, patterns: list[Pattern], output_dir: Path, tempo: int = 120
@@ -258,21 +362,23 @@ class MIDIEngine:
         # Set tempo on first track
         midi.addTempo(0, 0, tempo)
 
+        pitch_table = self._pitch_table()
+
         for track, pattern in enumerate(patterns):
             # Add track name
             midi.addTrackName(track, 0, pattern.name or f"Pattern {track + 1}")
 
             # Add pattern beats
-            for beat in pattern.beats:
-                midi_note = self.drum_kit.get_midi_note(beat.instrument)
-                midi.addNote(
-                    track=track,
-                    channel=channel,
-                    pitch=midi_note,
-                    time=beat.position,
-                    duration=beat.duration,
-                    volume=beat.velocity,
-                )
+            beats = pattern.arrays()
+            self._bulk_add_notes(
+                midi,
+                track,
+                channel,
+                beats.positions,
+                pitch_table[beats.instruments],
+                beats.durations,
+                beats.velocities,
+            )
 
         return midi
 
@@ -293,25 +399,24 @@ class MIDIEngine:
 
     def get_midi_info(self, song: Song) -> dict:
         """Get information about the MIDI file that would be generated."""
-        total_bars = song.total_bars()
-        duration_seconds = song.total_duration_seconds()
-        total_beats = sum(
-            len(section.pattern.beats) * section.bars
-            for section in song.sections
-        )
+        sections = []
+        total_beats = 0
+        for section in song.sections:
+            pattern_beats = len(section.pattern.beats) if section.pattern else 0
+            total_beats += pattern_beats * section.bars
+            sections.append(
+                {
+                    "name": section.name,
+                    "bars": section.bars,
+                    "pattern_beats": pattern_beats,
+                }
+            )
 
         return {
-            "total_bars": total_bars,
-            "duration_seconds": duration_seconds,
+            "total_bars": song.total_bars(),
+            "duration_seconds": song.total_duration_seconds(),
             "total_beats": total_beats,
             "tempo": song.tempo,
             "time_signature": str(song.time_signature),
-            "sections": [
-                {
-                    "name": section.name,
-                    "bars": section.bars,
-                    "pattern_beats": len(section.pattern.beats),
-                }
-                for section in song.sections
-            ],
+            "sections": sections,
         }
@@ -14,6 +14,14 @@ from midi_drums.models.reaper_models import (
 )
 from midi_drums.models.song import Song, TimeSignature
 
+# Header attributes and fixed settings rows shared by every new project.
+_PROJECT_ATTRIB: tuple[str, ...] = ("0.1", "7.0", "1234567890")
+_PROJECT_SETTINGS: tuple[tuple[str, ...], ...] = (
+    ("RIPPLE", "0"),
+    ("GROUPOVERRIDE", "0", "0", "0"),
+    ("AUTOXFADE", "1"),
+)
+
 
 def bars_to_seconds(
     bars: int, tempo: int, time_signature: TimeSignature
@@ -95,13 +103,12 @@ class ReaperEngine:
 
         project = rpp.Element(
             tag="REAPER_PROJECT",
-            attrib=["0.1", "7.0", "1234567890"],
+            attrib=list(_PROJECT_ATTRIB),
         )
 
-        # Add basic project settings
-        project.append(["RIPPLE", "0"])
-        project.append(["GROUPOVERRIDE", "0", "0", "0"])
-        project.append(["AUTOXFADE", "1"])
+        # Add basic project settings (fresh lists so callers may edit them)
+        for setting in _PROJECT_SETTINGS:
+            project.append(list(setting))
         project.append(
             [
                 "TEMPO",
@@ -127,17 +134,17 @@ class ReaperEngine:
             >>> markers = [Marker(0.0, "Start", marker_id=1)]
             >>> engine.add_markers(project, markers)
         """
+        # Count existing markers once and keep the tally as markers are added
+        marker_count = sum(
+            1 for c in project if isinstance(c, list) and c[0] == "MARKER"
+        )
         for marker in markers:
             # Auto-assign marker IDs if not provided
             if marker.marker_id is None:
-                existing_markers = [
-                    c
-                    for c in project
-                    if isinstance(c, list) and c[0] == "MARKER"
-                ]
-                marker.marker_id = len(existing_markers) + 1
+                marker.marker_id = marker_count + 1
 
             project.append(marker.to_rpp_list())
+            marker_count += 1
 
     def load_project(self, rpp_path: str) -> rpp.Element:
         """Load Reaper project from .rpp file.
@@ -173,9 +180,7 @@ class ReaperEngine:
             >>> project = engine.create_minimal_project()
             >>> engine.save_project(project, "output.rpp")
         """
-        output = rpp.dumps(project)
-        with open(output_path, "w") as f:
-            f.write(output)
+        Path(output_path).write_text(rpp.dumps(project))
 
     def calculate_marker_positions_from_song(self, song: Song) -> list[Marker]:
         """Calculate marker positions from Song structure.
@@ -4,17 +4,71 @@ This module implements professional-grade MIDI humanization techniques
 inspired by Toontrack MIDI libraries and real drummer analysis.
 """
 
-import random
+from bisect import bisect_left
+from collections.abc import Mapping
+from types import MappingProxyType
 
-from midi_drums.models.pattern import Beat, DrumInstrument, Pattern
+import numpy as np
 
-# Try to import numpy for Gaussian distribution, fallback to random if not available
-try:
-    import numpy as np
+from midi_drums.models.pattern import BeatArrays, DrumInstrument, Pattern
 
-    HAS_NUMPY = True
-except ImportError:
-    HAS_NUMPY = False
+# Style multipliers for timing variation
+_STYLE_MULTIPLIERS = MappingProxyType(
+    {
+        "tight": 0.5,  # Studio precision
+        "balanced": 1.0,  # Natural
+        "loose": 1.8,  # Live energy
+    }
+)
+
+# Humanization settings by section type; sections have different energy
+# levels and timing characteristics
+_SECTION_CONTEXTS = MappingProxyType(
+    {
+        "verse": MappingProxyType(
+            {
+                "timing_multiplier": 0.8,  # Tighter
+                "velocity_boost": 0,  # Normal volume
+                "accent_strength": 1.0,  # Normal accents
+            }
+        ),
+        "chorus": MappingProxyType(
+            {
+                "timing_multiplier": 1.2,  # Looser (more energy)
+                "velocity_boost": 10,  # Louder
+                "accent_strength": 1.3,  # Stronger accents
+            }
+        ),
+        "fill": MappingProxyType(
+            {
+                "timing_multiplier": 1.5,  # Loosest (fast playing)
+                "velocity_boost": 5,  # Slightly louder
+                "accent_strength": 1.5,  # Very strong accents
+            }
+        ),
+        "breakdown": MappingProxyType(
+            {
+                "timing_multiplier": 0.9,  # Tight but heavy
+                "velocity_boost": 15,  # Very loud
+                "accent_strength": 2.0,  # Maximum accents
+            }
+        ),
+        "intro": MappingProxyType(
+            {
+                "timing_multiplier": 0.85,  # Controlled
+                "velocity_boost": -5,  # Slightly softer
+                "accent_strength": 0.8,  # Subdued
+            }
+        ),
+        "outro": MappingProxyType(
+            {
+                "timing_multiplier": 1.0,  # Balanced
+                "velocity_boost": -10,  # Fading
+                "accent_strength": 0.7,  # Fading accents
+            }
+        ),
+    }
+)
 
 
 class AdvancedHumanizer:
@@ -31,6 +85,15 @@ class AdvancedHumanizer:
     Inspired by analysis of Toontrack MIDI libraries and professional recordings.
     """
 
+    __slots__ = (
+        "tempo",
+        "style",
+        "humanization_amount",
+        "multiplier",
+        "ms_per_beat",
+        "rng",
+    )
+
     # Instrument timing characteristics (ms offset at 120 BPM baseline)
     # Positive = behind beat, Negative = ahead of beat
     INSTRUMENT_TIMING_BIAS = {
@@ -96,6 +159,7 @@ class AdvancedHumanizer:
         tempo: int = 120,
         style: str = "balanced",  # tight, balanced, loose
         humanization_amount: float = 0.5,  # 0.0-1.0
+        seed: int | None = None,
     ):
         """Initialize advanced humanizer.
 
@@ -109,22 +173,25 @@ class AdvancedHumanizer:
                 - 0.0: Perfect quantization
                 - 0.5: Moderate humanization (recommended)
                 - 1.0: Maximum humanization
+            seed: Optional seed for reproducible humanization
         """
         self.tempo = tempo
         self.style = style
         self.humanization_amount = humanization_amount
 
-        # Style multipliers for timing variation
-        self.style_multipliers = {
-            "tight": 0.5,  # Studio precision
-            "balanced": 1.0,  # Natural
-            "loose": 1.8,  # Live energy
-        }
-        self.multiplier = self.style_multipliers.get(style, 1.0)
+        self.multiplier = _STYLE_MULTIPLIERS.get(style, 1.0)
 
         # Calculate ms per beat for timing conversions
         self.ms_per_beat = 60000.0 / self.tempo
 
+        # Random source for all timing and velocity draws
+        self.rng = np.random.default_rng(seed)
+
+    @property
+    def style_multipliers(self) -> Mapping[str, float]:
+        """Timing variance multiplier for each style (read-only)."""
+        return _STYLE_MULTIPLIERS
+
     def humanize_pattern(
         self,
         pattern: Pattern,
@@ -145,164 +212,228 @@ class AdvancedHumanizer:
         Returns:
             Humanized pattern with Gaussian timing, velocity curves, and micro-timing
         """
-        if self.humanization_amount == 0.0:
-            return pattern
+        return self.humanize_many([pattern], [section_type])[0]
 
-        # Get context-aware settings
-        context = self._get_context_settings(section_type)
+    def humanize_many(
+        self,
+        patterns: list[Pattern],
+        section_types: list[str] | None = None,
+    ) -> list[Pattern]:
+        """Humanize several patterns in one vectorized pass.
 
-        # Group beats that occur at similar times
-        beat_groups = self._group_beats_by_timing(pattern.beats)
+        All beats are concatenated into one set of arrays, humanized
+        together and split back per pattern, so the NumPy overhead is paid
+        once for the whole batch rather than once per pattern.
 
-        humanized_beats = []
+        Args:
+            patterns: Patterns to humanize
+            section_types: Musical context for each pattern (see
+                ``humanize_pattern``); defaults to 'verse' for every pattern
 
-        for position, beats in beat_groups.items():
-            # Apply micro-timing relationships (flams, offsets between limbs)
-            timed_beats = self._apply_micro_timing(beats, position, context)
+        Returns:
+            Humanized patterns, in input order. Patterns without beats, or
+            all patterns when the humanization amount is negligible, are
+            returned unchanged.
 
-            # Apply velocity curves and dynamics
-            velocity_beats = self._apply_velocity_curves(
-                timed_beats, position, context
+        Raises:
+            ValueError: If section_types and patterns differ in length
+        """
+        if section_types is None:
+            section_types = ["verse"] * len(patterns)
+        elif len(section_types) != len(patterns):
+            raise ValueError(
+                f"Got {len(section_types)} section types for "
+                f"{len(patterns)} patterns"
             )
 
-            humanized_beats.extend(velocity_beats)
+        # Nothing to humanize: an amount too small to matter, or no beats
+        results = list(patterns)
+        active = [i for i, pattern in enumerate(patterns) if pattern.beats]
+        effective_amount = self.humanization_amount * self.multiplier
+        if effective_amount < 1e-4 or not active:
+            return results
+
+        # Work on one columnar copy of every beat; each stage below updates
+        # its position and velocity columns in place
+        sizes = [len(patterns[i].beats) for i in active]
+        beats = BeatArrays.from_beats(
+            [beat for i in active for beat in patterns[i].beats]
+        )
+        pattern_ids = np.repeat(np.arange(len(active)), sizes)
+
+        # Get context-aware settings, spread to one entry per beat
+        contexts = [
+            self._get_context_settings(section_types[i]) for i in active
+        ]
+        timing_multiplier = np.repeat(
+            [context["timing_multiplier"] for context in contexts], sizes
+        )
+        velocity_boost = np.repeat(
+            [context["velocity_boost"] for context in contexts], sizes
+        )
+        accent_boost = np.repeat(
+            [int(10 * context["accent_strength"]) for context in contexts],
+            sizes,
+        )
+        duration_bars = np.repeat(
+            [patterns[i].duration_bars() for i in active], sizes
+        )
 
-        # Apply gradual fatigue (subtle velocity reduction over time)
-        if pattern.duration_bars() >= 8:
-            humanized_beats = self._apply_fatigue(
-                humanized_beats, pattern.duration_bars()
-            )
+        # Group beats that occur at similar times
+        group_ids, group_positions = self._group_beats_by_timing(
+            beats.positions, pattern_ids
+        )
+
+        # Downbeat masks for the timing and velocity stages, computed once
+        bar_offsets = group_positions % 4.0
+        on_bar_downbeat = bar_offsets < 0.01
+        on_beat = bar_offsets % 1.0 < 0.01
+
+        # Draw the Gaussian noise for every stage at once
+        timing_noise, velocity_noise = self.rng.standard_normal((2, len(beats)))
+
+        # Apply micro-timing relationships (flams, offsets between limbs)
+        self._apply_micro_timing(
+            beats, group_ids, on_beat, timing_noise, timing_multiplier
+        )
 
-        # Sort beats by position
-        humanized_beats.sort(key=lambda b: b.position)
+        # Apply velocity curves and dynamics
+        self._apply_velocity_curves(
+            beats, on_bar_downbeat, velocity_noise, velocity_boost, accent_boost
+        )
+
+        # Apply gradual fatigue (subtle velocity reduction over time)
+        self._apply_fatigue(beats, duration_bars)
 
-        return Pattern(
-            name=f"{pattern.name}_humanized",
-            beats=humanized_beats,
-            time_signature=pattern.time_signature,
-            subdivision=pattern.subdivision,
-            swing_ratio=pattern.swing_ratio,
-            metadata={**pattern.metadata, "humanization": "advanced"},
+        # Sort each pattern's beats by position, unless micro-timing kept
+        # them in order
+        positions = beats.positions
+        out_of_order = (positions[1:] < positions[:-1]) & (
+            pattern_ids[1:] == pattern_ids[:-1]
         )
+        if out_of_order.any():
+            beats = beats.take(np.lexsort((positions, pattern_ids)))
+        humanized_beats = beats.to_beats()
+
+        start = 0
+        for i, size in zip(active, sizes, strict=True):
+            pattern = patterns[i]
+            results[i] = Pattern(
+                name=f"{pattern.name}_humanized",
+                beats=humanized_beats[start : start + size],
+                time_signature=pattern.time_signature,
+                subdivision=pattern.subdivision,
+                swing_ratio=pattern.swing_ratio,
+                metadata={**pattern.metadata, "humanization": "advanced"},
+            )
+            start += size
+
+        return results
 
-    def _gaussian_timing_offset(
-        self, instrument: DrumInstrument, position: float
-    ) -> float:
-        """Generate Gaussian timing offset for instrument.
+    def _gaussian_timing_offsets(
+        self,
+        instruments: np.ndarray,
+        on_beat: np.ndarray,
+        noise: np.ndarray,
+        timing_multiplier: float | np.ndarray = 1.0,
+    ) -> np.ndarray:
+        """Generate Gaussian timing offsets for a batch of beats.
 
         Uses instrument-specific timing bias and tightness.
         Downbeats are naturally tighter (50% tighter timing).
 
         Args:
-            instrument: Drum instrument
-            position: Beat position in pattern
+            instruments: DrumInstrument values of the beats
+            on_beat: Whether each beat falls on a downbeat
+            noise: Standard normal draws, one per beat; scaled in place
+                into the returned offsets
+            timing_multiplier: Context scaling applied to the whole offset,
+                overall or per beat
 
         Returns:
-            Timing offset in beats (can be positive or negative)
+            Timing offsets in beats (can be positive or negative), one per
+            beat
         """
         # Get instrument characteristics
-        bias_ms = self.INSTRUMENT_TIMING_BIAS.get(instrument, 0.0)
-        tightness_ms = self.TIMING_TIGHTNESS.get(instrument, 4.0)
+        bias_ms = _TIMING_BIAS_MS[instruments]
+        tightness_ms = _TIMING_TIGHTNESS_MS[instruments]
 
         # Downbeats are tighter (50% reduction in variance)
-        is_downbeat = position % 1.0 < 0.01
-        if is_downbeat:
-            tightness_ms *= 0.5
+        tightness_ms[on_beat] *= 0.5
 
         # Apply humanization amount and style multiplier
         tightness_ms *= self.humanization_amount * self.multiplier
 
-        # Generate Gaussian offset (ms)
-        if HAS_NUMPY:
-            offset_ms = np.random.normal(bias_ms, tightness_ms)
-        else:
-            # Fallback: approximate Gaussian with sum of uniform randoms (Central Limit Theorem)
-            # Sum of 12 uniform randoms approximates Gaussian
-            offset_ms = bias_ms + (
-                sum(
-                    random.uniform(-tightness_ms, tightness_ms)
-                    for _ in range(12)
-                )
-                / 12.0
-            )
-
-        # Convert ms to beats (tempo-aware)
-        offset_beats = offset_ms / self.ms_per_beat
+        # Shape the draws into Gaussian offsets (ms), in place
+        offsets = noise
+        offsets *= tightness_ms
+        offsets += bias_ms
 
-        return offset_beats
+        # Convert ms to beats (tempo-aware) and scale for the context
+        offsets *= timing_multiplier
+        offsets /= self.ms_per_beat
+        return offsets
 
-    def _get_context_settings(self, section_type: str) -> dict:
+    def _get_context_settings(self, section_type: str) -> Mapping:
         """Get humanization settings based on musical context.
 
         Different sections have different energy levels and timing characteristics.
         """
-        contexts = {
-            "verse": {
-                "timing_multiplier": 0.8,  # Tighter
-                "velocity_boost": 0,  # Normal volume
-                "accent_strength": 1.0,  # Normal accents
-            },
-            "chorus": {
-                "timing_multiplier": 1.2,  # Looser (more energy)
-                "velocity_boost": 10,  # Louder
-                "accent_strength": 1.3,  # Stronger accents
-            },
-            "fill": {
-                "timing_multiplier": 1.5,  # Loosest (fast playing)
-                "velocity_boost": 5,  # Slightly louder
-                "accent_strength": 1.5,  # Very strong accents
-            },
-            "breakdown": {
-                "timing_multiplier": 0.9,  # Tight but heavy
-                "velocity_boost": 15,  # Very loud
-                "accent_strength": 2.0,  # Maximum accents
-            },
-            "intro": {
-                "timing_multiplier": 0.85,  # Controlled
-                "velocity_boost": -5,  # Slightly softer
-                "accent_strength": 0.8,  # Subdued
-            },
-            "outro": {
-                "timing_multiplier": 1.0,  # Balanced
-                "velocity_boost": -10,  # Fading
-                "accent_strength": 0.7,  # Fading accents
-            },
-        }
-        return contexts.get(section_type, contexts["verse"])
+        return _SECTION_CONTEXTS.get(section_type, _SECTION_CONTEXTS["verse"])
 
     def _group_beats_by_timing(
-        self, beats: list[Beat]
-    ) -> dict[float, list[Beat]]:
+        self, positions: np.ndarray, pattern_ids: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
         """Group beats that occur at similar times.
 
         Beats within ~10ms are considered simultaneous and need micro-timing.
+        Beats are sorted by position within their pattern and each group
+        takes every beat less than 10ms after its earliest beat, so
+        near-simultaneous hits are never split by a grid boundary and a
+        run of closely spaced hits cannot chain into one wide group. A
+        group's position is that of its earliest beat.
 
         Args:
-            beats: List of beats to group
+            positions: Beat positions
+            pattern_ids: Index of each beat's pattern
 
         Returns:
-            Dictionary mapping position to list of beats at that position
+            Tuple of (group index, group position), one entry per beat
         """
-        groups = {}
-        tolerance = 10.0 / self.ms_per_beat  # ~10ms tolerance
-
-        for beat in beats:
-            # Find existing group within tolerance
-            found_group = False
-            for pos in list(groups.keys()):
-                if abs(beat.position - pos) < tolerance:
-                    groups[pos].append(beat)
-                    found_group = True
-                    break
-
-            if not found_group:
-                groups[beat.position] = [beat]
+        tolerance = 10.0 / self.ms_per_beat
+        order = np.lexsort((positions, pattern_ids))
+        sorted_positions = positions[order]
+        sorted_patterns = pattern_ids[order]
+
+        # Groups never span patterns; within each pattern's run, the next
+        # group starts at the first beat a tolerance past the group's start
+        run_ends = np.flatnonzero(sorted_patterns[1:] != sorted_patterns[:-1])
+        run_ends = [*(run_ends + 1).tolist(), len(order)]
+        position_list = sorted_positions.tolist()
+        starts_group = np.zeros(len(order), dtype=bool)
+        start = 0
+        for end in run_ends:
+            while start < end:
+                starts_group[start] = True
+                start = bisect_left(
+                    position_list,
+                    position_list[start] + tolerance,
+                    start + 1,
+                    end,
+                )
 
-        return groups
+        group_ids = np.empty(len(order), dtype=np.intp)
+        group_ids[order] = np.cumsum(starts_group) - 1
+        return group_ids, sorted_positions[starts_group][group_ids]
 
     def _apply_micro_timing(
-        self, beats: list[Beat], position: float, context: dict
-    ) -> list[Beat]:
+        self,
+        beats: BeatArrays,
+        group_ids: np.ndarray,
+        on_beat: np.ndarray,
+        noise: np.ndarray,
+        timing_multiplier: np.ndarray,
+    ) -> BeatArrays:
         """Apply micro-timing relationships between simultaneous instruments.
 
         Simulates natural hand/foot coordination timing:
@@ -311,81 +442,74 @@ class AdvancedHumanizer:
         - Crashes naturally behind beat
 
         Args:
-            beats: Beats occurring at similar time
-            position: Base position in pattern
-            context: Context settings
+            beats: Beats to time; positions are updated in place
+            group_ids: Index of each beat's timing group
+            on_beat: Whether each beat's timing group falls on a downbeat
+            noise: Standard normal draws, one per beat
+            timing_multiplier: Context timing scale, one per beat
 
         Returns:
-            List of beats with micro-timing applied
+            The same beats, with micro-timing applied
         """
-        if len(beats) == 1:
-            # Single instrument - apply standard timing
-            beat = beats[0]
-            offset = self._gaussian_timing_offset(beat.instrument, position)
-            offset *= context["timing_multiplier"]
-
-            return [
-                Beat(
-                    position=max(
-                        0.0, beat.position + offset
-                    ),  # Prevent negative
-                    instrument=beat.instrument,
-                    velocity=beat.velocity,
-                    duration=beat.duration,
-                    ghost_note=beat.ghost_note,
-                    accent=beat.accent,
-                )
-            ]
-
-        # Multiple instruments - apply relational micro-timing
-        instruments = {b.instrument for b in beats}
-        timed_beats = []
-
-        for beat in beats:
-            # Base Gaussian offset
-            offset = self._gaussian_timing_offset(beat.instrument, position)
-            offset *= context["timing_multiplier"]
-
-            # Apply micro-flams for simultaneous kick + snare
-            # In real playing, kick leads by 1-3ms
-            if (
-                beat.instrument == DrumInstrument.KICK
-                and DrumInstrument.SNARE in instruments
-            ):
-                offset -= 0.002  # Kick 2ms early
-
-            elif (
-                beat.instrument == DrumInstrument.SNARE
-                and DrumInstrument.KICK in instruments
-            ):
-                offset += 0.001  # Snare 1ms late (total 3ms flam)
-
-            # Crashes naturally slightly behind everything
-            if beat.instrument in {
-                DrumInstrument.CRASH,
-                DrumInstrument.CHINA,
-                DrumInstrument.SPLASH,
-            }:
-                offset += 0.003  # 3ms extra delay on crashes
-
-            timed_beats.append(
-                Beat(
-                    position=max(
-                        0.0, beat.position + offset
-                    ),  # Prevent negative
-                    instrument=beat.instrument,
-                    velocity=beat.velocity,
-                    duration=beat.duration,
-                    ghost_note=beat.ghost_note,
-                    accent=beat.accent,
-                )
+        instruments = beats.instruments
+
+        # Base Gaussian offset
+        offsets = self._gaussian_timing_offsets(
+            instruments, on_beat, noise, timing_multiplier
+        )
+
+        # Relational micro-timing only applies when beats share a group;
+        # patterns of lone hits (e.g. straight hi-hats) skip it entirely
+        group_count = int(group_ids.max()) + 1 if len(group_ids) else 0
+        if group_count < len(group_ids):
+            self._apply_relational_offsets(
+                offsets, instruments, group_ids, group_count
             )
 
-        return timed_beats
+        # Prevent negative positions
+        offsets += beats.positions
+        np.maximum(offsets, 0.0, out=beats.positions)
+        return beats
+
+    @staticmethod
+    def _apply_relational_offsets(
+        offsets: np.ndarray,
+        instruments: np.ndarray,
+        group_ids: np.ndarray,
+        group_count: int,
+    ) -> None:
+        """Adjust timing offsets for instruments struck together.
+
+        Args:
+            offsets: Timing offsets in beats; updated in place
+            instruments: DrumInstrument values of the beats
+            group_ids: Index of each beat's timing group
+            group_count: Number of timing groups
+        """
+        # Apply micro-flams for simultaneous kick + snare
+        # In real playing, kick leads by 1-3ms
+        is_kick = instruments == DrumInstrument.KICK.value
+        is_snare = instruments == DrumInstrument.SNARE.value
+        group_has_kick = np.zeros(group_count, dtype=bool)
+        group_has_kick[group_ids[is_kick]] = True
+        group_has_snare = np.zeros(group_count, dtype=bool)
+        group_has_snare[group_ids[is_snare]] = True
+
+        offsets[is_kick & group_has_snare[group_ids]] -= 0.002  # Kick early
+        offsets[is_snare & group_has_kick[group_ids]] += 0.001  # Snare late
+
+        # Crashes naturally slightly behind everything else in their group
+        shared = np.bincount(group_ids, minlength=group_count)[group_ids] > 1
+        offsets[shared & _IS_DELAYED_CYMBAL[instruments]] += 0.003
 
     def _apply_velocity_curves(
-        self, beats: list[Beat], position: float, context: dict
-    ) -> list[Beat]:
+        self,
+        beats: BeatArrays,
+        on_bar_downbeat: np.ndarray,
+        noise: np.ndarray,
+        velocity_boost: np.ndarray,
+        accent_boost: np.ndarray,
+    ) -> BeatArrays:
         """Apply velocity humanization with musical awareness.
 
         Velocity ranges:
@@ -395,115 +519,113 @@ class AdvancedHumanizer:
         - Maximum: 115-127
 
         Args:
-            beats: Beats to apply velocity curves to
-            position: Position in pattern (for musical context)
-            context: Context settings
+            beats: Beats to apply velocity curves to; velocities are updated
+                in place
+            on_bar_downbeat: Whether each beat's timing group starts a bar
+                (for musical context)
+            noise: Standard normal draws, one per beat
+            velocity_boost: Context velocity boost, one per beat
+            accent_boost: Extra velocity for accented beats, one per beat
 
         Returns:
-            Beats with humanized velocities
+            The same beats, with humanized velocities
         """
-        velocity_beats = []
-
-        # Check if this is a downbeat (stronger)
-        is_downbeat = position % 4.0 < 0.01
-        downbeat_boost = 5 if is_downbeat else 0
-
-        for beat in beats:
-            # Determine base velocity range
-            if beat.ghost_note:
-                base_range = self.VELOCITY_RANGES["ghost"]
-                variance = 3  # Tight variance for ghosts
-            elif beat.accent:
-                base_range = self.VELOCITY_RANGES["accent"]
-                variance = 5  # Moderate variance
-            else:
-                base_range = self.VELOCITY_RANGES["normal"]
-                variance = 8  # Wider variance
-
-            # Calculate target velocity
-            target_velocity = (base_range[0] + base_range[1]) // 2
-
-            # Apply Gaussian variation
-            if HAS_NUMPY:
-                new_velocity = int(
-                    np.random.normal(
-                        target_velocity, variance * self.humanization_amount
-                    )
-                )
-            else:
-                # Fallback to uniform with slight bias toward center
-                variation = int(
-                    random.uniform(-variance, variance)
-                    * self.humanization_amount
-                )
-                new_velocity = target_velocity + variation
-
-            # Apply context boost (chorus louder, etc.)
-            boost = context["velocity_boost"] + downbeat_boost
+        # Determine base velocity range: ghost notes win over accents
+        hit_types = np.where(
+            beats.ghost_notes, _GHOST, np.where(beats.accents, _ACCENT, _NORMAL)
+        )
 
-            # Apply accent boost
-            if beat.accent:
-                accent_boost = int(10 * context["accent_strength"])
-                boost += accent_boost
+        # Apply Gaussian variation around the middle of each range
+        variation = noise
+        variation *= _VELOCITY_VARIANCES[hit_types]
+        variation *= self.humanization_amount
+        variation += _VELOCITY_TARGETS[hit_types]
+        velocities = variation.astype(np.int16)
 
-            new_velocity = new_velocity + boost
+        # Apply context boost (chorus louder, etc.)
+        velocities += velocity_boost
 
-            # Clamp to MIDI range
-            new_velocity = max(1, min(127, new_velocity))
+        # Check if this is a downbeat (stronger)
+        velocities[on_bar_downbeat] += 5
 
-            velocity_beats.append(
-                Beat(
-                    position=beat.position,
-                    instrument=beat.instrument,
-                    velocity=new_velocity,
-                    duration=beat.duration,
-                    ghost_note=beat.ghost_note,
-                    accent=beat.accent,
-                )
-            )
+        # Apply accent boost
+        velocities[beats.accents] += accent_boost[beats.accents]
 
-        return velocity_beats
+        # Clamp to MIDI range
+        np.clip(velocities, 1, 127, out=beats.velocities)
+        return beats
 
     def _apply_fatigue(
-        self, beats: list[Beat], duration_bars: float
-    ) -> list[Beat]:
+        self, beats: BeatArrays, duration_bars: np.ndarray
+    ) -> BeatArrays:
         """Apply subtle fatigue effect (velocity reduction over time).
 
-        Simulates natural drummer fatigue during long sections.
-        Effect is very subtle (max 5% reduction).
+        Simulates natural drummer fatigue during long sections (8 bars or
+        more). Effect is very subtle (max 5% reduction).
 
         Args:
-            beats: Beats to apply fatigue to
-            duration_bars: Pattern duration in bars
+            beats: Beats to apply fatigue to; velocities are updated in place
+            duration_bars: Duration in bars of each beat's pattern
 
         Returns:
-            Beats with subtle fatigue applied
+            The same beats, with subtle fatigue applied
         """
-        fatigued_beats = []
-
-        for beat in beats:
-            # Calculate progress through pattern (0.0 to 1.0)
-            progress = beat.position / (duration_bars * 4.0)
-
-            # Fatigue factor: 0-5% reduction based on progress
-            fatigue_factor = 1.0 - (progress * 0.05 * self.humanization_amount)
-
-            # Apply fatigue to velocity
-            new_velocity = int(beat.velocity * fatigue_factor)
-            new_velocity = max(1, new_velocity)
-
-            fatigued_beats.append(
-                Beat(
-                    position=beat.position,
-                    instrument=beat.instrument,
-                    velocity=new_velocity,
-                    duration=beat.duration,
-                    ghost_note=beat.ghost_note,
-                    accent=beat.accent,
-                )
-            )
-
-        return fatigued_beats
+        long_sections = duration_bars >= 8
+        if not long_sections.any():
+            return beats
+
+        # Fatigue factor: 0-5% reduction based on progress through the
+        # pattern (0.0 to 1.0), folded into one scale per beat
+        fatigue_per_beat = (
+            0.05 * self.humanization_amount / (duration_bars * 4.0)
+        )
+        fatigue_factor = beats.positions * -fatigue_per_beat
+        fatigue_factor += 1.0
+
+        # Apply fatigue to velocity
+        fatigued = (beats.velocities * fatigue_factor).astype(np.int16)
+        np.maximum(fatigued, 1, out=beats.velocities, where=long_sections)
+        return beats
+
+
+def _instrument_table(
+    values: dict[DrumInstrument, float | bool], default: float | bool
+) -> np.ndarray:
+    """Lay out per-instrument values in an array indexed by MIDI value."""
+    table = np.full(128, default)
+    for instrument, value in values.items():
+        table[instrument.value] = value
+    return table
+
+
+# Velocity hit types, indexing the velocity target and variance tables
+_GHOST, _NORMAL, _ACCENT = 0, 1, 2
+_VELOCITY_TARGETS = np.array(
+    [
+        sum(AdvancedHumanizer.VELOCITY_RANGES[hit_type]) // 2
+        for hit_type in ("ghost", "normal", "accent")
+    ],
+    dtype=np.float64,
+)
+_VELOCITY_VARIANCES = np.array([3.0, 8.0, 5.0])  # Ghosts tight, normal wide
+
+# Cymbals that sit slightly behind the other instruments they're struck
+# with, as a boolean mask indexed by DrumInstrument.value
+_IS_DELAYED_CYMBAL = _instrument_table(
+    dict.fromkeys(
+        (DrumInstrument.CRASH, DrumInstrument.CHINA, DrumInstrument.SPLASH),
+        True,
+    ),
+    False,
+)
+
+# Array forms of the timing tables, indexed by DrumInstrument.value
+_TIMING_BIAS_MS = _instrument_table(
+    AdvancedHumanizer.INSTRUMENT_TIMING_BIAS, 0.0
+)
+_TIMING_TIGHTNESS_MS = _instrument_table(
+    AdvancedHumanizer.TIMING_TIGHTNESS, 4.0
+)
 
 
 # Convenience function for quick humanization
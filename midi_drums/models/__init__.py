@@ -3,6 +3,7 @@
 from midi_drums.models.kit import DrumKit
 from midi_drums.models.pattern import (
     Beat,
+    BeatArrays,
     DrumInstrument,
     Pattern,
     TimeSignature,
@@ -12,6 +13,7 @@ from midi_drums.models.song import GenerationParameters, Section, Song
 __all__ = [
     "Pattern",
     "Beat",
+    "BeatArrays",
     "TimeSignature",
     "DrumInstrument",
     "Song",
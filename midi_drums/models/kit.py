@@ -1,13 +1,31 @@
 """Drum kit configuration and instrument mapping."""
 
+import sys
+from collections.abc import Iterator, Mapping
 from dataclasses import dataclass, field
+from types import MappingProxyType
+
+import numpy as np
 
 from midi_drums.models.pattern import DrumInstrument
 
+_VELOCITY_BLOCK_SIZE = 1024
+
+# Velocity category names. They are interned so that dict lookups in
+# velocity_ranges succeed on the identity check without comparing text.
+_KICK, _SNARE, _HIHAT, _TOMS, _CYMBALS, _RIDE = map(
+    sys.intern, ("kick", "snare", "hihat", "toms", "cymbals", "ride")
+)
+
+_rng = np.random.default_rng()
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class VelocityRange:
-    """Velocity range for realistic drum dynamics."""
+    """Velocity range for realistic drum dynamics.
+
+    Ranges are immutable, so one instance can be shared between kits.
+    """
 
     min_velocity: int = 1
     max_velocity: int = 127
@@ -15,18 +33,119 @@ class VelocityRange:
 
     def __post_init__(self):
         """Validate velocity values."""
-        for vel in [
-            self.min_velocity,
-            self.max_velocity,
-            self.default_velocity,
-        ]:
-            if not 1 <= vel <= 127:
-                raise ValueError(f"Velocity must be 1-127, got {vel}")
+        if not (
+            1 <= self.min_velocity <= 127
+            and 1 <= self.max_velocity <= 127
+            and 1 <= self.default_velocity <= 127
+        ):
+            vel = next(
+                v
+                for v in (
+                    self.min_velocity,
+                    self.max_velocity,
+                    self.default_velocity,
+                )
+                if not 1 <= v <= 127
+            )
+            raise ValueError(f"Velocity must be 1-127, got {vel}")
         if self.min_velocity > self.max_velocity:
             raise ValueError("Min velocity cannot be greater than max velocity")
 
 
-@dataclass
+# Velocity category of each instrument; anything unlisted is treated as toms
+_CATEGORY_MAP: dict[DrumInstrument, str] = {
+    DrumInstrument.KICK: _KICK,
+    DrumInstrument.SNARE: _SNARE,
+    DrumInstrument.RIM: _SNARE,
+    DrumInstrument.CLOSED_HH: _HIHAT,
+    DrumInstrument.CLOSED_HH_EDGE: _HIHAT,
+    DrumInstrument.CLOSED_HH_TIP: _HIHAT,
+    DrumInstrument.TIGHT_HH_EDGE: _HIHAT,
+    DrumInstrument.TIGHT_HH_TIP: _HIHAT,
+    DrumInstrument.PEDAL_HH: _HIHAT,
+    DrumInstrument.OPEN_HH: _HIHAT,
+    DrumInstrument.OPEN_HH_1: _HIHAT,
+    DrumInstrument.OPEN_HH_2: _HIHAT,
+    DrumInstrument.OPEN_HH_3: _HIHAT,
+    DrumInstrument.OPEN_HH_MAX: _HIHAT,
+    DrumInstrument.MID_TOM: _TOMS,
+    DrumInstrument.FLOOR_TOM: _TOMS,
+    DrumInstrument.CRASH: _CYMBALS,
+    DrumInstrument.SPLASH: _CYMBALS,
+    DrumInstrument.CHINA: _CYMBALS,
+    DrumInstrument.RIDE: _RIDE,
+    DrumInstrument.RIDE_BELL: _RIDE,
+}
+
+# The same categories indexed by MIDI note value, which avoids hashing the
+# enum member on every lookup
+_CATEGORY_BY_VALUE: list[str | None] = [None] * 128
+for _instrument, _category in _CATEGORY_MAP.items():
+    _CATEGORY_BY_VALUE[_instrument.value] = _category
+del _instrument, _category
+
+_DEFAULT_VELOCITY_RANGE = VelocityRange()
+
+
+# Preset names accepted by DrumKit.from_preset and the factory each uses.
+# Factories are looked up by name on the class so subclasses get their own.
+_PRESET_FACTORIES: dict[str, str] = {
+    "ezdrummer3": "create_ezdrummer3_kit",
+    "ez_drummer_3": "create_ezdrummer3_kit",
+    "studio_drummer3": "create_studio_drummer3_kit",
+    "studio_drummer_3": "create_studio_drummer3_kit",
+    "addictive_drums": "create_addictive_drums_kit",
+    "addictive_drums_2": "create_addictive_drums_kit",
+    "bfd3": "create_bfd3_kit",
+    "gm_drums": "create_gm_drums_kit",
+    "gm": "create_gm_drums_kit",
+    "general_midi": "create_gm_drums_kit",
+    "modo_drums": "create_modo_drums_kit",
+    "ml_drums": "create_ml_drums_kit",
+    "metal": "create_metal_kit",
+    "jazz": "create_jazz_kit",
+}
+
+_AVAILABLE_PRESETS = ", ".join(sorted(_PRESET_FACTORIES))
+
+
+# Preset velocity ranges, frozen at import. Ranges are immutable, so kits
+# share the instances and only copy the mapping.
+_STANDARD_VELOCITY_RANGES: Mapping[str, VelocityRange] = MappingProxyType(
+    {
+        _KICK: VelocityRange(95, 120, 110),
+        _SNARE: VelocityRange(90, 127, 115),
+        _HIHAT: VelocityRange(60, 100, 80),
+        _TOMS: VelocityRange(85, 115, 100),
+        _CYMBALS: VelocityRange(70, 120, 95),
+        _RIDE: VelocityRange(65, 100, 80),
+    }
+)
+
+_METAL_VELOCITY_RANGES: Mapping[str, VelocityRange] = MappingProxyType(
+    {
+        _KICK: VelocityRange(100, 127, 120),  # Powerful kicks
+        _SNARE: VelocityRange(110, 127, 120),  # Loud snares
+        _HIHAT: VelocityRange(40, 90, 65),  # Quieter hihats
+        _TOMS: VelocityRange(90, 120, 105),  # Punchy toms
+        _CYMBALS: VelocityRange(90, 127, 110),  # Loud crashes
+        _RIDE: VelocityRange(60, 100, 80),  # Controlled ride
+    }
+)
+
+_JAZZ_VELOCITY_RANGES: Mapping[str, VelocityRange] = MappingProxyType(
+    {
+        _KICK: VelocityRange(70, 100, 85),  # Softer kicks
+        _SNARE: VelocityRange(60, 110, 85),  # Dynamic snares
+        _HIHAT: VelocityRange(40, 85, 65),  # Subtle hihats
+        _TOMS: VelocityRange(60, 105, 80),  # Warm toms
+        _CYMBALS: VelocityRange(50, 100, 75),  # Controlled crashes
+        _RIDE: VelocityRange(45, 90, 70),  # Prominent ride
+    }
+)
+
+
+@dataclass(slots=True)
 class DrumKit:
     """Drum kit configuration with instrument mappings and velocity ranges."""
 
@@ -35,61 +154,61 @@ class DrumKit:
 
     # Velocity ranges for different instrument types
     velocity_ranges: dict[str, VelocityRange] = field(
-        default_factory=lambda: {
-            "kick": VelocityRange(95, 120, 110),
-            "snare": VelocityRange(90, 127, 115),
-            "hihat": VelocityRange(60, 100, 80),
-            "toms": VelocityRange(85, 115, 100),
-            "cymbals": VelocityRange(70, 120, 95),
-            "ride": VelocityRange(65, 100, 80),
-        }
+        default_factory=_STANDARD_VELOCITY_RANGES.copy
     )
 
     # Custom instrument mappings (overrides default DrumInstrument values)
     custom_mappings: dict[DrumInstrument, int] = field(default_factory=dict)
 
+    # Pre-drawn random velocities keyed by (min, max) range
+    _velocity_buffers: dict[tuple[int, int], Iterator[int]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        """Intern category keys that were built at runtime (e.g. from JSON)."""
+        ranges = self.velocity_ranges
+        if not all(
+            type(key) is str and sys.intern(key) is key for key in ranges
+        ):
+            for key in ranges:
+                if not isinstance(key, str):
+                    raise TypeError(
+                        "Velocity range keys must be category names (str), "
+                        f"got {key!r}"
+                    )
+            self.velocity_ranges = {
+                sys.intern(str(key)): value for key, value in ranges.items()
+            }
+
     def get_midi_note(self, instrument: DrumInstrument) -> int:
         """Get MIDI note number for an instrument."""
         return self.custom_mappings.get(instrument, instrument.value)
 
     def get_velocity_range(self, instrument: DrumInstrument) -> VelocityRange:
         """Get velocity range for an instrument category."""
-        # Map instruments to velocity categories
-        category_map = {
-            DrumInstrument.KICK: "kick",
-            DrumInstrument.SNARE: "snare",
-            DrumInstrument.RIM: "snare",
-            DrumInstrument.CLOSED_HH: "hihat",
-            DrumInstrument.CLOSED_HH_EDGE: "hihat",
-            DrumInstrument.CLOSED_HH_TIP: "hihat",
-            DrumInstrument.TIGHT_HH_EDGE: "hihat",
-            DrumInstrument.TIGHT_HH_TIP: "hihat",
-            DrumInstrument.PEDAL_HH: "hihat",
-            DrumInstrument.OPEN_HH: "hihat",
-            DrumInstrument.OPEN_HH_1: "hihat",
-            DrumInstrument.OPEN_HH_2: "hihat",
-            DrumInstrument.OPEN_HH_3: "hihat",
-            DrumInstrument.OPEN_HH_MAX: "hihat",
-            DrumInstrument.MID_TOM: "toms",
-            DrumInstrument.FLOOR_TOM: "toms",
-            DrumInstrument.CRASH: "cymbals",
-            DrumInstrument.SPLASH: "cymbals",
-            DrumInstrument.CHINA: "cymbals",
-            DrumInstrument.RIDE: "ride",
-            DrumInstrument.RIDE_BELL: "ride",
-        }
-
-        category = category_map.get(instrument, "toms")
-        return self.velocity_ranges.get(category, VelocityRange())
+        category = _CATEGORY_BY_VALUE[instrument._value_] or _TOMS
+        return self.velocity_ranges.get(category, _DEFAULT_VELOCITY_RANGE)
 
     def randomize_velocity(self, instrument: DrumInstrument) -> int:
-        """Get a randomized velocity within the instrument's range."""
-        import random
+        """Get a randomized velocity within the instrument's range.
 
+        Velocities are drawn in blocks per range and handed out one at a
+        time, so a full render pays for one RNG call per block.
+        """
         velocity_range = self.get_velocity_range(instrument)
-        return random.randint(
-            velocity_range.min_velocity, velocity_range.max_velocity
-        )
+        key = (velocity_range.min_velocity, velocity_range.max_velocity)
+        buffer = self._velocity_buffers.get(key)
+        velocity = next(buffer, None) if buffer is not None else None
+        if velocity is None:
+            buffer = iter(
+                _rng.integers(
+                    key[0], key[1], _VELOCITY_BLOCK_SIZE, endpoint=True
+                ).tolist()
+            )
+            self._velocity_buffers[key] = buffer
+            velocity = next(buffer)
+        return velocity
 
     @classmethod
     def create_ezdrummer3_kit(cls) -> "DrumKit":
@@ -108,14 +227,7 @@ class DrumKit:
         return cls(
             name="Metal Kit",
             channel=9,
-            velocity_ranges={
-                "kick": VelocityRange(100, 127, 120),  # Powerful kicks
-                "snare": VelocityRange(110, 127, 120),  # Loud snares
-                "hihat": VelocityRange(40, 90, 65),  # Quieter hihats
-                "toms": VelocityRange(90, 120, 105),  # Punchy toms
-                "cymbals": VelocityRange(90, 127, 110),  # Loud crashes
-                "ride": VelocityRange(60, 100, 80),  # Controlled ride
-            },
+            velocity_ranges=dict(_METAL_VELOCITY_RANGES),
         )
 
     @classmethod
@@ -124,14 +236,7 @@ class DrumKit:
         return cls(
             name="Jazz Kit",
             channel=9,
-            velocity_ranges={
-                "kick": VelocityRange(70, 100, 85),  # Softer kicks
-                "snare": VelocityRange(60, 110, 85),  # Dynamic snares
-                "hihat": VelocityRange(40, 85, 65),  # Subtle hihats
-                "toms": VelocityRange(60, 105, 80),  # Warm toms
-                "cymbals": VelocityRange(50, 100, 75),  # Controlled crashes
-                "ride": VelocityRange(45, 90, 70),  # Prominent ride
-            },
+            velocity_ranges=dict(_JAZZ_VELOCITY_RANGES),
         )
 
     @classmethod
@@ -209,32 +314,14 @@ class DrumKit:
         Raises:
             ValueError: If preset_name is not recognized
         """
-        preset_map = {
-            "ezdrummer3": cls.create_ezdrummer3_kit,
-            "ez_drummer_3": cls.create_ezdrummer3_kit,
-            "studio_drummer3": cls.create_studio_drummer3_kit,
-            "studio_drummer_3": cls.create_studio_drummer3_kit,
-            "addictive_drums": cls.create_addictive_drums_kit,
-            "addictive_drums_2": cls.create_addictive_drums_kit,
-            "bfd3": cls.create_bfd3_kit,
-            "gm_drums": cls.create_gm_drums_kit,
-            "gm": cls.create_gm_drums_kit,
-            "general_midi": cls.create_gm_drums_kit,
-            "modo_drums": cls.create_modo_drums_kit,
-            "ml_drums": cls.create_ml_drums_kit,
-            "metal": cls.create_metal_kit,
-            "jazz": cls.create_jazz_kit,
-        }
-
-        preset_name_lower = preset_name.lower()
-        if preset_name_lower not in preset_map:
-            available_presets = ", ".join(sorted(preset_map.keys()))
+        factory_name = _PRESET_FACTORIES.get(preset_name.lower())
+        if factory_name is None:
             raise ValueError(
                 f"Unknown preset '{preset_name}'. "
-                f"Available presets: {available_presets}"
+                f"Available presets: {_AVAILABLE_PRESETS}"
             )
 
-        return preset_map[preset_name_lower]()
+        return getattr(cls, factory_name)()
 
     @classmethod
     def list_presets(cls) -> dict[str, str]:
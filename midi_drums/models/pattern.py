@@ -1,13 +1,21 @@
 """Pattern data models and core drum pattern structures."""
 
 import logging
-import random
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from enum import Enum
+from itertools import repeat
 from typing import Any
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
+_rng = np.random.default_rng()
+
+# Integer tick resolution for exact grid arithmetic on beat positions
+TICKS_PER_BEAT = 960
+
 
 class DrumInstrument(Enum):
     """Standard drum kit instruments with MIDI note mappings."""
@@ -35,7 +43,7 @@ class DrumInstrument(Enum):
     CHINA = 52
 
 
-@dataclass
+@dataclass(slots=True)
 class TimeSignature:
     """Time signature representation."""
 
@@ -50,7 +58,7 @@ class TimeSignature:
         return f"{self.numerator}/{self.denominator}"
 
 
-@dataclass
+@dataclass(slots=True)
 class Beat:
     """Individual drum hit within a pattern."""
 
@@ -71,7 +79,135 @@ class Beat:
             )
 
 
-@dataclass
+# DrumInstrument lookup by MIDI note value, used to rebuild beats from arrays
+_INSTRUMENT_BY_VALUE: list[DrumInstrument | None] = [None] * 128
+for _instrument in DrumInstrument:
+    _INSTRUMENT_BY_VALUE[_instrument.value] = _instrument
+del _instrument
+
+
+def _as_column(values: Iterable, dtype: type, label: str) -> np.ndarray:
+    """Return ``values`` as a one-dimensional array of ``dtype``.
+
+    Any iterable is accepted, including generators.
+
+    Raises:
+        ValueError: If the values are not numbers or not one-dimensional
+    """
+    if not isinstance(values, np.ndarray):
+        values = list(values)
+    try:
+        column = np.asarray(values, dtype=dtype)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"{label} must be a flat sequence of numbers") from e
+    if column.ndim != 1:
+        raise ValueError(
+            f"{label} must be one-dimensional, got shape {column.shape}"
+        )
+    return column
+
+
+@dataclass(slots=True)
+class BeatArrays:
+    """Columnar (struct-of-arrays) snapshot of a list of beats.
+
+    Each field is a NumPy array with one entry per beat, in the same order
+    as the source beats. Instruments are stored as their DrumInstrument
+    MIDI note values so they can index lookup tables directly.
+    """
+
+    positions: np.ndarray  # float64
+    instruments: np.ndarray  # int16 DrumInstrument values
+    velocities: np.ndarray  # int16
+    durations: np.ndarray  # float64
+    ghost_notes: np.ndarray  # bool
+    accents: np.ndarray  # bool
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    @classmethod
+    def from_beats(cls, beats: list[Beat]) -> "BeatArrays":
+        """Build the columnar view of ``beats``."""
+        n = len(beats)
+        return cls(
+            positions=np.fromiter(
+                (b.position for b in beats), dtype=np.float64, count=n
+            ),
+            # _value_ is the member's plain attribute; .value goes through
+            # a descriptor and costs several times more per beat
+            instruments=np.fromiter(
+                (b.instrument._value_ for b in beats), dtype=np.int16, count=n
+            ),
+            velocities=np.fromiter(
+                (b.velocity for b in beats), dtype=np.int16, count=n
+            ),
+            durations=np.fromiter(
+                (b.duration for b in beats), dtype=np.float64, count=n
+            ),
+            ghost_notes=np.fromiter(
+                (b.ghost_note for b in beats), dtype=np.bool_, count=n
+            ),
+            accents=np.fromiter(
+                (b.accent for b in beats), dtype=np.bool_, count=n
+            ),
+        )
+
+    def take(self, indices: np.ndarray) -> "BeatArrays":
+        """Return the beats at ``indices``, in that order, as new arrays."""
+        return BeatArrays(
+            positions=self.positions[indices],
+            instruments=self.instruments[indices],
+            velocities=self.velocities[indices],
+            durations=self.durations[indices],
+            ghost_notes=self.ghost_notes[indices],
+            accents=self.accents[indices],
+        )
+
+    def ticks(self, ticks_per_beat: int = TICKS_PER_BEAT) -> np.ndarray:
+        """Return positions rounded to integer ticks (int32).
+
+        Grid tests on ticks are exact, unlike float modulo on positions.
+        """
+        return np.rint(self.positions * ticks_per_beat).astype(np.int32)
+
+    def at_position(
+        self, position: float, tolerance: float = 0.01
+    ) -> np.ndarray:
+        """Return the indices of beats within ``tolerance`` of ``position``."""
+        return np.flatnonzero(np.abs(self.positions - position) <= tolerance)
+
+    def of_instrument(self, instrument: DrumInstrument) -> np.ndarray:
+        """Return the indices of beats played on ``instrument``."""
+        return np.flatnonzero(self.instruments == instrument.value)
+
+    def duration_bars(self, beats_per_bar: int = 4) -> float:
+        """Calculate the duration of these beats in bars (at least one)."""
+        if not len(self):
+            return 1.0
+        return max(1.0, (float(self.positions.max()) + 1.0) / beats_per_bar)
+
+    def to_beats(self) -> list[Beat]:
+        """Materialize the arrays back into Beat objects."""
+        # map() feeds the columns to Beat positionally, in field order,
+        # which skips the keyword matching a comprehension over zip()
+        # would pay per beat; Pattern.copy() relies on the same order
+        return list(
+            map(
+                Beat,
+                self.positions.tolist(),
+                map(
+                    _INSTRUMENT_BY_VALUE.__getitem__, self.instruments.tolist()
+                ),
+                self.velocities.tolist(),
+                self.durations.tolist(),
+                self.ghost_notes.tolist(),
+                self.accents.tolist(),
+            )
+        )
+
+
+@dataclass(slots=True)
 class Pattern:
     """Complete drum pattern with timing and metadata."""
 
@@ -99,6 +235,80 @@ class Pattern:
         self.beats.append(beat)
         return self
 
+    def add_beats(
+        self,
+        positions: Iterable[float],
+        instrument: DrumInstrument | Iterable[DrumInstrument],
+        velocity: int | Iterable[int] = 100,
+        duration: float = 0.25,
+    ) -> "Pattern":
+        """Add one beat per position.
+
+        Positions and velocities are validated as whole arrays before any
+        beat is added, so a bad value leaves the pattern unchanged.
+
+        Args:
+            positions: Beat positions
+            instrument: One instrument for all beats, or one per position
+            velocity: One velocity for all beats, or one per position
+            duration: Note duration in beats
+
+        Raises:
+            ValueError: If positions or velocities are not flat sequences of
+                numbers, a position is negative, a velocity is not 0-127
+                or the number of velocities or instruments does not match
+                the positions
+        """
+        positions = _as_column(positions, np.float64, "Positions")
+        if isinstance(velocity, int | np.integer):
+            velocities = np.full(positions.shape, velocity)
+        else:
+            velocities = _as_column(velocity, np.int64, "Velocities")
+            if len(velocities) != len(positions):
+                raise ValueError(
+                    f"Expected {len(positions)} velocities, "
+                    f"got {len(velocities)}"
+                )
+        if positions.size:
+            if positions.min() < 0:
+                raise ValueError(
+                    f"Position cannot be negative, got {positions.min()}"
+                )
+            if velocities.min() < 0 or velocities.max() > 127:
+                raise ValueError(
+                    "Velocity must be 0-127, got "
+                    f"{velocities.min()}-{velocities.max()}"
+                )
+
+        count = positions.size
+        if isinstance(instrument, DrumInstrument):
+            instruments = repeat(instrument, count)
+        else:
+            instruments = list(instrument)
+            if len(instruments) != count:
+                raise ValueError(
+                    f"Expected {count} instruments, got {len(instruments)}"
+                )
+
+        self.beats.extend(
+            map(
+                Beat,
+                positions.tolist(),
+                instruments,
+                velocities.tolist(),
+                repeat(duration, count),
+            )
+        )
+        return self
+
+    def arrays(self) -> BeatArrays:
+        """Return a columnar snapshot of the beats for vectorized processing.
+
+        The arrays are built on each call and do not track later changes
+        to ``beats``.
+        """
+        return BeatArrays.from_beats(self.beats)
+
     def get_beats_at_position(
         self, position: float, tolerance: float = 0.01
     ) -> list[Beat]:
@@ -109,6 +319,28 @@ class Pattern:
             if abs(beat.position - position) <= tolerance
         ]
 
+    def get_beats_at_positions(
+        self, positions: Iterable[float], tolerance: float = 0.01
+    ) -> list[list[Beat]]:
+        """Get the beats at each of several positions in one pass.
+
+        The beat positions are sorted once and every query is answered
+        with a binary search, instead of scanning all beats per position.
+        Beats in each result keep their order in the pattern.
+        """
+        beat_positions = self.arrays().positions
+        order = np.argsort(beat_positions, kind="stable")
+        sorted_positions = beat_positions[order]
+        queries = np.fromiter(positions, dtype=np.float64)
+        starts = np.searchsorted(sorted_positions, queries - tolerance, "left")
+        ends = np.searchsorted(sorted_positions, queries + tolerance, "right")
+
+        beats = self.beats
+        return [
+            [beats[i] for i in np.sort(order[start:end]).tolist()]
+            for start, end in zip(starts.tolist(), ends.tolist(), strict=True)
+        ]
+
     def get_beats_by_instrument(self, instrument: DrumInstrument) -> list[Beat]:
         """Get all beats for a specific instrument."""
         return [beat for beat in self.beats if beat.instrument == instrument]
@@ -117,7 +349,9 @@ class Pattern:
         """Calculate pattern duration in bars."""
         if not self.beats:
             return 1.0
-        max_position = max(beat.position for beat in self.beats)
+        # A list comprehension feeds max() faster than a generator, and
+        # building an array first costs more than the reduction saves
+        max_position = max([beat.position for beat in self.beats])
         return max(
             1.0, (max_position + 1.0) / self.time_signature.beats_per_bar
         )
@@ -125,28 +359,28 @@ class Pattern:
     def humanize(
         self, timing_variance: float = 0.02, velocity_variance: float = 10
     ) -> "Pattern":
-        """Apply humanization to timing and velocity."""
-        humanized_beats = []
-        for beat in self.beats:
-            # Add slight timing variations
-            timing_offset = random.uniform(-timing_variance, timing_variance)
-            new_position = max(0, beat.position + timing_offset)
-
-            # Add velocity variations
-            velocity_offset = random.randint(
-                -velocity_variance, velocity_variance
-            )
-            new_velocity = max(1, min(127, beat.velocity + velocity_offset))
-
-            humanized_beat = Beat(
-                position=new_position,
-                instrument=beat.instrument,
-                velocity=new_velocity,
-                duration=beat.duration,
-                ghost_note=beat.ghost_note,
-                accent=beat.accent,
-            )
-            humanized_beats.append(humanized_beat)
+        """Apply humanization to timing and velocity.
+
+        Offsets for every beat are drawn in one batch, so the cost per beat
+        is dominated by rebuilding the Beat objects.
+        """
+        beats = self.arrays()
+        timing_offsets = _rng.uniform(
+            -timing_variance, timing_variance, len(beats)
+        )
+        velocity_offsets = _rng.integers(
+            -velocity_variance,
+            velocity_variance,
+            len(beats),
+            dtype=beats.velocities.dtype,
+            endpoint=True,
+        )
+        # Accumulate into the offset buffers so no temporaries are allocated
+        timing_offsets += beats.positions
+        np.maximum(timing_offsets, 0.0, out=beats.positions)
+        velocity_offsets += beats.velocities
+        np.clip(velocity_offsets, 1, 127, out=beats.velocities)
+        humanized_beats = beats.to_beats()
 
         return Pattern(
             name=f"{self.name}_humanized",
@@ -170,14 +404,15 @@ class Pattern:
 
         return Pattern(
             name=self.name,
+            # Positional, in Beat field order; see BeatArrays.to_beats
             beats=[
                 Beat(
-                    position=beat.position,
-                    instrument=beat.instrument,
-                    velocity=beat.velocity,
-                    duration=beat.duration,
-                    ghost_note=beat.ghost_note,
-                    accent=beat.accent,
+                    beat.position,
+                    beat.instrument,
+                    beat.velocity,
+                    beat.duration,
+                    beat.ghost_note,
+                    beat.accent,
                 )
                 for beat in self.beats
             ],
@@ -193,6 +428,11 @@ class Pattern:
 class PatternBuilder:
     """Builder pattern for creating drum patterns."""
 
+    __slots__ = ("pattern",)
+
+    # Hi-hat instrument indexed by the ``open`` flag
+    _HIHAT = (DrumInstrument.CLOSED_HH, DrumInstrument.OPEN_HH)
+
     def __init__(self, name: str, time_signature: TimeSignature | None = None):
         self.pattern = Pattern(
             name=name, time_signature=time_signature or TimeSignature()
@@ -212,10 +452,28 @@ class PatternBuilder:
         self, position: float, velocity: int = 80, open: bool = False
     ) -> "PatternBuilder":
         """Add hi-hat at position."""
-        instrument = (
-            DrumInstrument.OPEN_HH if open else DrumInstrument.CLOSED_HH
-        )
-        self.pattern.add_beat(position, instrument, velocity)
+        self.pattern.add_beat(position, self._HIHAT[open], velocity)
+        return self
+
+    def hihats(
+        self,
+        positions: Iterable[float],
+        velocity: int | Iterable[int] = 80,
+        open: bool | Iterable[bool] = False,
+    ) -> "PatternBuilder":
+        """Add hi-hats at each position in one call.
+
+        Args:
+            positions: Hi-hat positions
+            velocity: One velocity for all hits, or one per position
+            open: One open flag for all hits, or one per position
+        """
+        if isinstance(open, bool | np.bool_):
+            instrument = self._HIHAT[bool(open)]
+        else:
+            flags = _as_column(open, np.bool_, "Open flags")
+            instrument = map(self._HIHAT.__getitem__, flags.tolist())
+        self.pattern.add_beats(positions, instrument, velocity)
         return self
 
     def ride(self, position: float, velocity: int = 80) -> "PatternBuilder":
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 
 # ---------------------------------------------------------------------------
 # Color constants for section types
@@ -45,12 +46,30 @@ def get_section_color(section_name: str) -> str:
     return SECTION_COLORS.get(section_name.lower(), DEFAULT_SECTION_COLOR)
 
 
+@lru_cache(maxsize=None)
+def _reaper_color(color: str | int) -> str:
+    """Convert a ``"#RRGGBB"`` color to Reaper's ``0x01BBGGRR`` integer.
+
+    Integers are taken to be in Reaper format already. Unparseable colors
+    map to ``"0"`` (no custom color). Results are cached because markers
+    reuse a handful of section colors.
+    """
+    if not isinstance(color, str):
+        return str(color)
+    try:
+        rgb = int(color.removeprefix("#"), 16)
+    except ValueError:
+        return "0"
+    red, green, blue = rgb >> 16, (rgb >> 8) & 0xFF, rgb & 0xFF
+    return str(0x01000000 | blue << 16 | green << 8 | red)
+
+
 # ---------------------------------------------------------------------------
 # Marker
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class Marker:
     """Reaper marker representation.
 
@@ -73,19 +92,16 @@ class Marker:
             List in format: ["MARKER", id, position, "name", color, flags]
 
         Example:
-            >>> marker = Marker(8.0, "Verse", marker_id=2)
+            >>> marker = Marker(8.0, "Verse", "#0066CC", marker_id=2)
             >>> marker.to_rpp_list()
-            ['MARKER', '2', '8.0', 'Verse', '0', '0']
+            ['MARKER', '2', '8.000000', 'Verse', '30172672', '0']
         """
-        # Convert hex color to integer if needed (simplified for now)
-        color_int = "0"  # TODO: Convert hex to Reaper format (0x01BBGGRR)
-
         return [
             "MARKER",
             str(self.marker_id if self.marker_id else "1"),
             f"{self.position_seconds:.6f}",
             self.name,
-            color_int,
+            _reaper_color(self.color),
             "0",  # Flags (0 = regular marker)
         ]
 
@@ -125,7 +141,7 @@ class Marker:
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class ReaperTrack:
     """Reaper track representation.
 
@@ -1,14 +1,44 @@
 """Song structure and generation parameter models."""
 
-from dataclasses import dataclass, field
+import random
+from collections.abc import Iterable
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
+from operator import attrgetter
+from types import MappingProxyType
 from typing import Any
 
+import numpy as np
+
 from midi_drums.models.pattern import Pattern, TimeSignature
+from midi_drums.utils.cache import get_or_create
+
+_rng = np.random.default_rng()
+
+# C-level accessor for summing section lengths without a generator frame
+_get_bars = attrgetter("bars")
 
+# Anything Section's schedules can draw from; see _uniform()
+RandomSource = np.random.Generator | random.Random
 
-@dataclass
+# GenerationParameters fields that must lie in 0.0-1.0, in validation order
+_UNIT_PARAMETERS = (
+    "complexity",
+    "dynamics",
+    "humanization",
+    "fill_frequency",
+    "swing_ratio",
+    "context_blend",
+)
+
+
+@dataclass(frozen=True, slots=True)
 class GenerationParameters:
-    """Parameters controlling pattern generation."""
+    """Parameters controlling pattern generation.
+
+    Instances are immutable; use :meth:`interned` to share one object
+    between identical parameter sets.
+    """
 
     genre: str
     style: str = "default"
@@ -27,32 +57,199 @@ class GenerationParameters:
 
     def __post_init__(self):
         """Validate parameters."""
-        for param_name, value in [
-            ("complexity", self.complexity),
-            ("dynamics", self.dynamics),
-            ("humanization", self.humanization),
-            ("fill_frequency", self.fill_frequency),
-            ("swing_ratio", self.swing_ratio),
-            ("context_blend", self.context_blend),
-        ]:
-            if not 0.0 <= value <= 1.0:
-                raise ValueError(
-                    f"{param_name} must be between 0.0 and 1.0, got {value}"
-                )
-
-
-@dataclass
+        values = (
+            self.complexity,
+            self.dynamics,
+            self.humanization,
+            self.fill_frequency,
+            self.swing_ratio,
+            self.context_blend,
+        )
+        # sum() is NaN if any value is, which min()/max() would miss
+        total = sum(values)
+        if min(values) < 0.0 or max(values) > 1.0 or total != total:
+            for param_name, value in zip(_UNIT_PARAMETERS, values, strict=True):
+                if not 0.0 <= value <= 1.0:
+                    raise ValueError(
+                        f"{param_name} must be between 0.0 and 1.0, got {value}"
+                    )
+
+    def __reduce__(self):
+        """Pickle and copy with a plain dict of custom parameters.
+
+        Interned instances hold a read-only view, which cannot be pickled.
+        """
+        values = [getattr(self, f.name) for f in fields(self)]
+        values[-1] = dict(self.custom_parameters)
+        return type(self), tuple(values)
+
+    @classmethod
+    def interned(
+        cls,
+        genre: str,
+        style: str = "default",
+        custom_parameters: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> "GenerationParameters":
+        """Return a shared instance for these parameter values.
+
+        Args:
+            genre: Genre name
+            style: Style name
+            custom_parameters: Extra parameters
+            **kwargs: Any other GenerationParameters field
+
+        Returns:
+            Cached GenerationParameters, whose custom_parameters is a
+            read-only view shared between callers. If any value is
+            unhashable, a new uncached instance with its own dict instead.
+        """
+        custom_parameters = custom_parameters or {}
+        try:
+            return _interned_parameters(
+                genre, style, frozenset(custom_parameters.items()), **kwargs
+            )
+        except TypeError:
+            # Unhashable values (e.g. lists) cannot key the cache
+            return cls(
+                genre,
+                style,
+                custom_parameters=dict(custom_parameters),
+                **kwargs,
+            )
+
+
+def _uniform(rng: RandomSource | None, count: int) -> np.ndarray:
+    """Draw ``count`` uniforms on [0, 1) in one call.
+
+    A stdlib ``random.Random`` is still accepted, drawn from one value at a
+    time, so callers with seeded stdlib generators keep working.
+    """
+    if isinstance(rng, random.Random):
+        return np.fromiter(
+            (rng.random() for _ in range(count)), dtype=np.float64, count=count
+        )
+    return (rng or _rng).random(count)
+
+
+@lru_cache(maxsize=256)
+def _interned_parameters(
+    genre: str, style: str, custom: frozenset, **kwargs: Any
+) -> GenerationParameters:
+    """Build the GenerationParameters cached by ``interned``."""
+    return GenerationParameters(
+        genre,
+        style,
+        custom_parameters=MappingProxyType(dict(custom)),
+        **kwargs,
+    )
+
+
+@dataclass(frozen=True, slots=True, eq=False)
 class Fill:
-    """A drum fill pattern."""
+    """A drum fill pattern.
+
+    Fills are immutable value objects; use :meth:`intern` to share one
+    instance between sections built from the same pattern and settings.
+    Patterns are mutable, so fills compare and hash on the identity of
+    their pattern rather than its contents.
+    """
 
     pattern: Pattern
     trigger_probability: float = 1.0  # Probability this fill will be used
     section_position: str = "end"  # "start", "middle", "end"
 
+    def _key(self) -> tuple[int, float, str]:
+        return (
+            id(self.pattern),
+            self.trigger_probability,
+            self.section_position,
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Fill):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self) -> int:
+        return hash(self._key())
+
+    @classmethod
+    def intern(
+        cls,
+        pattern: Pattern,
+        trigger_probability: float = 1.0,
+        section_position: str = "end",
+    ) -> "Fill":
+        """Return a shared Fill for this pattern object and settings.
+
+        Keyed on the pattern's identity; see ``get_or_create``.
+        """
+        return get_or_create(
+            _INTERNED_FILLS,
+            (id(pattern), trigger_probability, section_position),
+            lambda: cls(pattern, trigger_probability, section_position),
+            _INTERNED_FILLS_LIMIT,
+        )
+
+
+# Fill.intern cache, evicted oldest first once full
+_INTERNED_FILLS: dict[tuple[int, float, str], Fill] = {}
+_INTERNED_FILLS_LIMIT = 256
+
+
+# Fill.section_position values, in the order FillArrays encodes them
+FILL_POSITIONS = ("start", "middle", "end")
+_FILL_POSITION_CODES = {name: code for code, name in enumerate(FILL_POSITIONS)}
+
+
+@dataclass(slots=True)
+class FillArrays:
+    """Columnar (struct-of-arrays) snapshot of a list of fills.
+
+    Each field is a NumPy array with one entry per fill, in the same order
+    as the source fills. Positions are indices into FILL_POSITIONS, or -1
+    for an unrecognised position.
+    """
+
+    probabilities: np.ndarray  # float64 trigger probabilities
+    positions: np.ndarray  # int8
+
+    def __len__(self) -> int:
+        return len(self.probabilities)
+
+    @classmethod
+    def from_fills(cls, fills: list[Fill]) -> "FillArrays":
+        """Build the columnar view of ``fills``."""
+        n = len(fills)
+        return cls(
+            probabilities=np.fromiter(
+                (fill.trigger_probability for fill in fills),
+                dtype=np.float64,
+                count=n,
+            ),
+            positions=np.fromiter(
+                (
+                    _FILL_POSITION_CODES.get(fill.section_position, -1)
+                    for fill in fills
+                ),
+                dtype=np.int8,
+                count=n,
+            ),
+        )
+
+    def at_position(self, section_position: str) -> np.ndarray:
+        """Return indices of fills placed at ``section_position``."""
+        code = _FILL_POSITION_CODES.get(section_position, -1)
+        return np.flatnonzero(self.positions == code)
 
-@dataclass
+
+@dataclass(frozen=True, slots=True, eq=False)
 class PatternVariation:
-    """Variation of a base pattern."""
+    """Variation of a base pattern.
+
+    Compares and hashes on the identity of its pattern, like :class:`Fill`.
+    """
 
     pattern: Pattern
     probability: float = (
@@ -62,8 +259,20 @@ class PatternVariation:
         None  # Specific bars to apply variation, None = any
     )
 
+    def _key(self) -> tuple[int, float, tuple[int, ...] | None]:
+        bars = None if self.bars is None else tuple(self.bars)
+        return id(self.pattern), self.probability, bars
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PatternVariation):
+            return NotImplemented
+        return self._key() == other._key()
 
-@dataclass
+    def __hash__(self) -> int:
+        return hash(self._key())
+
+
+@dataclass(slots=True)
 class Section:
     """Song section (verse, chorus, etc.) with pattern and variations."""
 
@@ -74,37 +283,197 @@ class Section:
     fills: list[Fill] = field(default_factory=list)
     section_parameters: dict[str, Any] = field(default_factory=dict)
 
-    def get_effective_pattern(self, bar_number: int) -> Pattern:
+    def get_effective_pattern(
+        self, bar_number: int, rng: RandomSource | None = None
+    ) -> Pattern:
         """Get the pattern for a specific bar, considering variations."""
-        # Check if any variations should apply to this bar
-        for variation in self.variations:
-            if variation.bars is None or bar_number in variation.bars:
-                import random
-
-                if random.random() < variation.probability:
-                    return variation.pattern
-        return self.pattern
+        if not self.variations:
+            return self.pattern
+        return self.pattern_schedule((bar_number,), rng)[bar_number]
+
+    def pattern_schedule(
+        self,
+        bar_numbers: Iterable[int] | None = None,
+        rng: RandomSource | None = None,
+    ) -> dict[int, Pattern]:
+        """Decide up front which pattern each bar plays.
+
+        Args:
+            bar_numbers: Bars to decide for; defaults to every bar
+            rng: Generator to draw from; defaults to a module-level one
+
+        Returns:
+            Mapping of bar number to the pattern it plays
+        """
+        bar_numbers = list(
+            range(self.bars) if bar_numbers is None else bar_numbers
+        )
+        if not self.variations:
+            return dict.fromkeys(bar_numbers, self.pattern)
+
+        variation_ids, _ = self.bar_decisions(bar_numbers, rng=rng)
+        population = [variation.pattern for variation in self.variations]
+        population.append(self.pattern)  # Index -1 means the base pattern
+        return {
+            bar: population[index]
+            for bar, index in zip(
+                bar_numbers, variation_ids.tolist(), strict=True
+            )
+        }
+
+    def bar_decisions(
+        self,
+        bar_numbers: Iterable[int] | None = None,
+        fill_frequency: float = 0.0,
+        rng: RandomSource | None = None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Roll the variation and fill decisions for many bars at once.
+
+        Applicable variations are tried in order and each wins with its own
+        probability, as if rolled one after another. Those odds are folded
+        into per-bar cumulative probabilities so every bar is settled by a
+        single uniform draw, with all bars drawn in one call.
+
+        Args:
+            bar_numbers: Bars to decide for; defaults to every bar
+            fill_frequency: Chance (0.0-1.0) that any given bar gets a fill
+            rng: Generator to draw from; defaults to a module-level one
+
+        Returns:
+            Tuple of (index into ``variations`` or -1 for the base pattern,
+            whether the bar gets a fill), one entry per bar
+        """
+        bars = np.fromiter(
+            range(self.bars) if bar_numbers is None else bar_numbers,
+            dtype=np.int64,
+        )
+        fill_draws, variation_draws = _uniform(rng, 2 * len(bars)).reshape(
+            2, len(bars)
+        )
+        fill_mask = fill_draws < fill_frequency
+
+        if not self.variations:
+            return np.full(len(bars), -1, dtype=np.intp), fill_mask
+
+        miss_chances = [
+            1.0 - min(max(variation.probability, 0.0), 1.0)
+            for variation in self.variations
+        ]
+        if all(variation.bars is None for variation in self.variations):
+            # Every variation applies everywhere: bisect one shared table of
+            # cumulative win chances
+            cum_chances = 1.0 - np.cumprod(miss_chances)
+            variation_ids = np.searchsorted(
+                cum_chances, variation_draws, side="right"
+            )
+            variation_ids[variation_ids == len(miss_chances)] = -1
+            return variation_ids, fill_mask
+
+        applies = np.ones((len(bars), len(self.variations)), dtype=bool)
+        for column, variation in enumerate(self.variations):
+            if variation.bars is not None:
+                applies[:, column] = np.isin(bars, variation.bars)
+        # Chance that none of the first k applicable variations has won
+        none_yet = np.cumprod(np.where(applies, miss_chances, 1.0), axis=1)
+        won = variation_draws[:, None] < 1.0 - none_yet
+        variation_ids = np.where(won.any(axis=1), won.argmax(axis=1), -1)
+        return variation_ids, fill_mask
+
+    def fill_arrays(self) -> FillArrays:
+        """Return a columnar snapshot of the fills for vectorized selection.
+
+        Each Fill is frozen, but the ``fills`` list itself is edited in
+        place (appended to, items replaced), so the arrays are built on
+        each call rather than cached, as with ``Pattern.arrays()``.
+        """
+        return FillArrays.from_fills(self.fills)
+
+    def select_fills(
+        self, k: int, rng: RandomSource | None = None
+    ) -> list[Fill]:
+        """Pick up to ``k`` distinct fills, weighted by trigger probability.
+
+        Each fill gets an exponential key ``-log(U) / weight`` and the ``k``
+        smallest keys win (weighted sampling without replacement), so picking
+        several fills costs one draw per fill and a partial sort.
+
+        Args:
+            k: Maximum number of fills to pick
+            rng: Generator to draw from; defaults to a module-level one
+
+        Returns:
+            Chosen fills, most strongly preferred first. Fills with no
+            trigger probability are never chosen.
+        """
+        weights = self.fill_arrays().probabilities
+        candidates = np.flatnonzero(weights > 0)
+        k = min(k, len(candidates))
+        if k <= 0:
+            return []
+
+        # log1p(-U) keeps U == 0.0 from producing an infinite key
+        keys = -np.log1p(-_uniform(rng, len(candidates))) / weights[candidates]
+        chosen = np.argpartition(keys, k - 1)[:k]
+        chosen = chosen[np.argsort(keys[chosen])]
+        return [self.fills[index] for index in candidates[chosen].tolist()]
 
     def should_add_fill(
-        self, bar_number: int, fill_frequency: float
+        self,
+        bar_number: int,
+        fill_frequency: float,
+        rng: RandomSource | None = None,
     ) -> Fill | None:
         """Determine if a fill should be added at this bar."""
-        import random
-
-        if random.random() < fill_frequency and self.fills:
-            # Choose fill based on probabilities
-            total_prob = sum(fill.trigger_probability for fill in self.fills)
-            if total_prob > 0:
-                rand_val = random.random() * total_prob
-                current_sum = 0
-                for fill in self.fills:
-                    current_sum += fill.trigger_probability
-                    if rand_val <= current_sum:
-                        return fill
-        return None
-
-
-@dataclass
+        if not self.fills or fill_frequency <= 0.0:
+            return None
+        return self.fill_schedule(fill_frequency, (bar_number,), rng).get(
+            bar_number
+        )
+
+    def fill_schedule(
+        self,
+        fill_frequency: float,
+        bar_numbers: Iterable[int] | None = None,
+        rng: RandomSource | None = None,
+    ) -> dict[int, Fill]:
+        """Decide up front which bars get a fill, and which fill.
+
+        Args:
+            fill_frequency: Chance (0.0-1.0) that any given bar gets a fill
+            bar_numbers: Bars to decide for; defaults to every bar
+            rng: Generator to draw from; defaults to a module-level one
+
+        Returns:
+            Mapping of bar number to the chosen fill, for bars that get one
+        """
+        if not self.fills or fill_frequency <= 0.0:
+            return {}
+
+        # Choose fills by bisecting the cumulative trigger probabilities
+        cum_weights = np.cumsum(self.fill_arrays().probabilities)
+        total = cum_weights[-1]
+        if total <= 0:
+            return {}
+
+        bar_numbers = list(
+            range(self.bars) if bar_numbers is None else bar_numbers
+        )
+        # A draw below the gate is uniform on [0, gate), so rescaled it also
+        # picks the fill: one random number per bar instead of two.
+        gate = min(fill_frequency, 1.0)
+        draws = _uniform(rng, len(bar_numbers))
+        hits = np.flatnonzero(draws < gate)
+        picks = np.searchsorted(
+            cum_weights, draws[hits] * (total / gate), side="right"
+        )
+        np.minimum(picks, len(self.fills) - 1, out=picks)
+        return {
+            bar_numbers[hit]: self.fills[pick]
+            for hit, pick in zip(hits.tolist(), picks.tolist(), strict=True)
+        }
+
+
+@dataclass(slots=True)
 class Song:
     """Complete song structure with sections and global parameters."""
 
@@ -115,38 +484,134 @@ class Song:
     global_parameters: GenerationParameters | None = None
     metadata: dict[str, Any] = field(default_factory=dict)
 
+    # Memoized total_bars() and sections grouped by name, each paired with
+    # the _sections_key() it was computed for, so direct edits to
+    # ``sections`` or to a section's name or bars are still picked up.
+    _total_bars_cache: tuple[tuple, int] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _section_index_cache: tuple[tuple, dict[str, list[Section]]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Seconds per beat, paired with the tempo it was computed for
+    _seconds_per_beat_cache: tuple[int, float] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def __post_init__(self):
         """Validate song parameters."""
-        if not 60 <= self.tempo <= 300:
-            raise ValueError(
-                f"Tempo must be between 60-300 BPM, got {self.tempo}"
-            )
+        self.set_tempo(self.tempo)
+
+    def set_tempo(self, tempo: int) -> "Song":
+        """Validate and set the song tempo.
+
+        Args:
+            tempo: Tempo in BPM (60-300)
+
+        Returns:
+            The song, for chaining
+        """
+        if not 60 <= tempo <= 300:
+            raise ValueError(f"Tempo must be between 60-300 BPM, got {tempo}")
+        self.tempo = tempo
+        self._seconds_per_beat_cache = (tempo, 60.0 / tempo)
+        return self
+
+    def seconds_per_beat(self) -> float:
+        """Return the length of one beat in seconds at the song tempo.
+
+        Cached per tempo, so assigning ``tempo`` directly is still picked up.
+        """
+        cache = self._seconds_per_beat_cache
+        if cache is not None and cache[0] == self.tempo:
+            return cache[1]
+        self._seconds_per_beat_cache = (self.tempo, 60.0 / self.tempo)
+        return self._seconds_per_beat_cache[1]
+
+    def _sections_key(self) -> tuple:
+        """Return what the section caches depend on, one entry per section.
+
+        The name index keeps the sections it was built from alive, so their
+        ids cannot be reused by other sections while it is cached.
+        """
+        return tuple((id(s), s.name, s.bars) for s in self.sections)
 
     def add_section(self, section: Section) -> "Song":
-        """Add a section to the song."""
+        """Add a section to the song.
+
+        Up-to-date caches are extended with the new section rather than
+        rebuilt from scratch.
+        """
+        key = self._sections_key()
         self.sections.append(section)
+        new_key = (*key, (id(section), section.name, section.bars))
+
+        totals = self._total_bars_cache
+        if totals is not None and totals[0] == key:
+            self._total_bars_cache = (new_key, totals[1] + section.bars)
+        else:
+            self._total_bars_cache = None
+
+        index_cache = self._section_index_cache
+        if index_cache is not None and index_cache[0] == key:
+            index = index_cache[1]
+            index.setdefault(section.name, []).append(section)
+            self._section_index_cache = (new_key, index)
+        else:
+            self._section_index_cache = None
         return self
 
+    def invalidate_cache(self) -> None:
+        """Drop cached totals and the section name index.
+
+        Edits to ``sections`` and to section names or bars are detected
+        automatically; this just frees the cached values.
+        """
+        self._total_bars_cache = None
+        self._section_index_cache = None
+
     def total_bars(self) -> int:
-        """Calculate total number of bars in the song."""
-        return sum(section.bars for section in self.sections)
+        """Calculate total number of bars in the song.
+
+        The result is cached until the sections, or their bar counts, change.
+        """
+        key = self._sections_key()
+        cache = self._total_bars_cache
+        if cache is not None and cache[0] == key:
+            return cache[1]
+        total = sum(map(_get_bars, self.sections))
+        self._total_bars_cache = (key, total)
+        return total
 
     def total_duration_seconds(self) -> float:
-        """Calculate total song duration in seconds."""
+        """Calculate total song duration in seconds.
+
+        Built on the cached ``total_bars`` and ``seconds_per_beat``; the time
+        signature is read fresh since it may be changed at any time.
+        """
         total_beats = self.total_bars() * self.time_signature.beats_per_bar
-        beats_per_second = self.tempo / 60.0
-        return total_beats / beats_per_second
+        return total_beats * self.seconds_per_beat()
+
+    def _section_index(self) -> dict[str, list[Section]]:
+        """Return sections grouped by name, in song order."""
+        key = self._sections_key()
+        cache = self._section_index_cache
+        if cache is not None and cache[0] == key:
+            return cache[1]
+        index: dict[str, list[Section]] = {}
+        for section in self.sections:
+            index.setdefault(section.name, []).append(section)
+        self._section_index_cache = (key, index)
+        return index
 
     def get_section_by_name(self, name: str) -> Section | None:
         """Find first section with the given name."""
-        for section in self.sections:
-            if section.name == name:
-                return section
-        return None
+        matches = self._section_index().get(name)
+        return matches[0] if matches else None
 
     def get_sections_by_name(self, name: str) -> list[Section]:
         """Find all sections with the given name."""
-        return [section for section in self.sections if section.name == name]
+        return list(self._section_index().get(name, ()))
 
     @classmethod
     def create_simple_structure(
@@ -157,25 +622,28 @@ class Song:
         style: str = "default",
     ) -> "Song":
         """Create a song with basic verse-chorus structure."""
-        from midi_drums.models.pattern import (
-            Pattern,  # Import here to avoid circular imports
-        )
-
         # Create placeholder patterns (will be generated by plugins)
         verse_pattern = Pattern(f"{genre}_{style}_verse")
         chorus_pattern = Pattern(f"{genre}_{style}_chorus")
 
         song = cls(name=name, tempo=tempo)
-        song.global_parameters = GenerationParameters(genre=genre, style=style)
+        song.global_parameters = GenerationParameters.interned(
+            genre, style=style
+        )
 
         # Standard pop/rock structure
-        song.add_section(Section("intro", verse_pattern, bars=4))
-        song.add_section(Section("verse", verse_pattern, bars=8))
-        song.add_section(Section("chorus", chorus_pattern, bars=8))
-        song.add_section(Section("verse", verse_pattern, bars=8))
-        song.add_section(Section("chorus", chorus_pattern, bars=8))
-        song.add_section(Section("bridge", verse_pattern, bars=4))
-        song.add_section(Section("chorus", chorus_pattern, bars=8))
-        song.add_section(Section("outro", chorus_pattern, bars=4))
+        song.sections.extend(
+            (
+                Section("intro", verse_pattern, bars=4),
+                Section("verse", verse_pattern, bars=8),
+                Section("chorus", chorus_pattern, bars=8),
+                Section("verse", verse_pattern, bars=8),
+                Section("chorus", chorus_pattern, bars=8),
+                Section("bridge", verse_pattern, bars=4),
+                Section("chorus", chorus_pattern, bars=8),
+                Section("outro", chorus_pattern, bars=4),
+            )
+        )
+        song.invalidate_cache()
 
         return song
@@ -12,26 +12,34 @@ Usage:
     pattern = TripletVocabulary().apply(pattern, intensity=0.9)
 """
 
-from midi_drums.modifications.drummer_mods import (
-    BehindBeatTiming,
-    DrummerModification,
-    FastChopsTriplets,
-    GhostNoteLayer,
-    HeavyAccents,
-    LinearCoordination,
-    MechanicalPrecision,
-    MinimalCreativity,
-    ModificationRegistry,
-    PocketStretching,
-    ShuffleFeelApplication,
-    SpeedPrecision,
-    TripletVocabulary,
-    TwistedAccents,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from midi_drums.modifications.drummer_mods import (
+        MODIFICATIONS_BY_NAME,
+        BehindBeatTiming,
+        ColumnarModification,
+        DrummerModification,
+        FastChopsTriplets,
+        GhostNoteLayer,
+        HeavyAccents,
+        LinearCoordination,
+        MechanicalPrecision,
+        MinimalCreativity,
+        ModificationPipeline,
+        ModificationRegistry,
+        PocketStretching,
+        ShuffleFeelApplication,
+        SpeedPrecision,
+        TripletVocabulary,
+        TwistedAccents,
+    )
 
 __all__ = [
-    # Base class
+    # Base classes
     "DrummerModification",
+    "ColumnarModification",
     # Concrete modifications
     "BehindBeatTiming",
     "TripletVocabulary",
@@ -45,6 +53,31 @@ __all__ = [
     "SpeedPrecision",
     "TwistedAccents",
     "MechanicalPrecision",
+    # Composition
+    "ModificationPipeline",
     # Registry
     "ModificationRegistry",
+    "MODIFICATIONS_BY_NAME",
 ]
+
+# Modifications are imported on first access (PEP 562) so that importing
+# this package stays cheap until a modification is actually used.
+_LAZY = dict.fromkeys(__all__, "midi_drums.modifications.drummer_mods")
+
+
+def __getattr__(name: str) -> Any:
+    """Import a modification the first time it is accessed."""
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the lazily imported modifications alongside module globals."""
+    return sorted({*globals(), *__all__})
@@ -0,0 +1,64 @@
+"""Array kernels shared by the drummer modifications.
+
+Each kernel works on the columns of a BeatArrays snapshot and either
+updates them in place or returns a new column, so modifications can be
+written as a few kernel calls over the whole pattern at once.
+"""
+
+import numpy as np
+
+
+def shift_main_hits(
+    positions: np.ndarray,
+    instruments: np.ndarray,
+    ghost_notes: np.ndarray,
+    instrument: int,
+    offset: float,
+) -> None:
+    """Move non-ghost hits on ``instrument`` by ``offset`` beats, in place."""
+    positions[(instruments == instrument) & ~ghost_notes] += offset
+
+
+def quantize_blend(positions: np.ndarray, grid: float, blend: float) -> None:
+    """Pull positions towards a grid, in place.
+
+    ``blend`` of 0.0 leaves positions untouched, 1.0 snaps them onto the
+    grid. Ties round half to even, like round().
+    """
+    quantized = np.divide(positions, grid)
+    np.round(quantized, out=quantized)
+    quantized *= grid
+    quantized *= blend
+    positions *= 1 - blend
+    positions += quantized
+
+
+def blend_velocities(
+    velocities: np.ndarray, targets: np.ndarray, blend: float
+) -> np.ndarray:
+    """Return velocities moved ``blend`` of the way towards ``targets``.
+
+    Results are truncated towards zero, like int().
+    """
+    blended = velocities * (1 - blend)
+    blended += targets * blend
+    return blended.astype(velocities.dtype)
+
+
+def accent_contrast(
+    velocities: np.ndarray,
+    accents: np.ndarray,
+    ghost_notes: np.ndarray,
+    boost: int,
+    cut: int,
+) -> np.ndarray:
+    """Return velocities with accents boosted and ghost notes cut.
+
+    Accents are capped at 127 and ghost notes floored at 20; accented
+    ghost notes count as accents.
+    """
+    boosted = np.minimum(velocities + boost, 127)
+    softened = np.maximum(velocities - cut, 20)
+    return np.where(
+        accents, boosted, np.where(ghost_notes, softened, velocities)
+    )
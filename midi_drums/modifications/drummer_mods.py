@@ -11,21 +11,127 @@ Each modification represents a specific drumming technique or characteristic:
 - Genre-specific techniques
 """
 
-import random
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from itertools import compress
+from operator import attrgetter
+from types import MappingProxyType
+from typing import ClassVar
+
+import numpy as np
 
 from midi_drums.config import TIMING, VELOCITY
-from midi_drums.models.pattern import Beat, DrumInstrument, Pattern
+from midi_drums.models.pattern import Beat, BeatArrays, DrumInstrument, Pattern
+from midi_drums.modifications import _kernels
+
+# MIDI note values, for comparing against BeatArrays.instruments
+_SNARE = DrumInstrument.SNARE.value
+_CLOSED_HH = DrumInstrument.CLOSED_HH.value
+
+_rng = np.random.default_rng()
+
+# Sort key for beats; attrgetter runs in C, unlike a lambda
+_get_position = attrgetter("position")
+
+# Cymbals that MinimalCreativity thins out
+_THINNED_CYMBALS = frozenset(
+    (DrumInstrument.CLOSED_HH, DrumInstrument.OPEN_HH, DrumInstrument.RIDE)
+)
+
+# Priority system for linear playing, indexed by MIDI note value; the
+# highest ranked hit wins a shared slot in LinearCoordination
+_PRIORITY_TABLE = np.zeros(128, dtype=np.int8)
+for _instrument, _rank in {
+    DrumInstrument.SNARE: 5,
+    DrumInstrument.KICK: 4,
+    DrumInstrument.CRASH: 3,
+    DrumInstrument.RIDE: 3,
+    DrumInstrument.MID_TOM: 2,
+    DrumInstrument.FLOOR_TOM: 2,
+    DrumInstrument.CLOSED_HH: 1,
+}.items():
+    _PRIORITY_TABLE[_instrument.value] = _rank
+del _instrument, _rank
+
+
+def _velocity_targets(targets: dict[DrumInstrument, int]) -> np.ndarray:
+    """Return target velocities indexed by MIDI note value.
+
+    Instruments without a target hold -1, meaning keep their velocity.
+    """
+    table = np.full(128, -1, dtype=np.int16)
+    for instrument, velocity in targets.items():
+        table[instrument.value] = velocity
+    return table
+
+
+# Velocities that SpeedPrecision and MechanicalPrecision blend towards
+_SPEED_TARGETS = _velocity_targets(
+    {
+        DrumInstrument.KICK: VELOCITY.KICK_HEAVY,
+        DrumInstrument.SNARE: VELOCITY.SNARE_HEAVY,
+        DrumInstrument.CLOSED_HH: VELOCITY.HIHAT_NORMAL,
+    }
+)
+_MECHANICAL_TARGETS = _velocity_targets(
+    {
+        DrumInstrument.KICK: VELOCITY.KICK_HEAVY,
+        DrumInstrument.SNARE: VELOCITY.SNARE_HEAVY,
+    }
+)
+
+# Six-note triplet fills for TripletVocabulary and FastChopsTriplets, as
+# (offset from fill start, instrument, velocity, accent)
+_TRIPLET_FILL = tuple(
+    (i * TIMING.SIXTEENTH_TRIPLET, instrument, VELOCITY.TOM_HEAVY, i % 3 == 0)
+    for i, instrument in enumerate(
+        (
+            DrumInstrument.MID_TOM,
+            DrumInstrument.MID_TOM,
+            DrumInstrument.FLOOR_TOM,
+            DrumInstrument.FLOOR_TOM,
+            DrumInstrument.FLOOR_TOM,
+            DrumInstrument.KICK,
+        )
+    )
+)
+_CHOPS_FILL = tuple(
+    (
+        i * TIMING.SIXTEENTH_TRIPLET,
+        DrumInstrument.SNARE,
+        VELOCITY.SNARE_HEAVY if i % 2 == 0 else VELOCITY.SNARE_NORMAL,
+        i == 0,
+    )
+    for i in range(6)
+)
 
 
+@dataclass
 class DrummerModification(ABC):
     """Base class for drummer style modifications.
 
     All modifications implement the apply() method which receives a pattern
     and returns a modified version (immutable - returns new pattern).
+
+    Stochastic modifications draw from ``rng`` when one is given, so passing
+    a seeded generator makes apply() reproducible; otherwise they share a
+    module-level generator.
     """
 
+    # Modification name for logging and identification; a class attribute
+    # so registries can read it without instantiating the class
+    name: ClassVar[str]
+
+    rng: np.random.Generator | None = field(
+        default=None, kw_only=True, repr=False, compare=False
+    )
+
+    @property
+    def _generator(self) -> np.random.Generator:
+        """Generator to draw from: ``rng`` or the shared default."""
+        return self.rng or _rng
+
     @abstractmethod
     def apply(self, pattern: Pattern, intensity: float = 1.0) -> Pattern:
         """Apply modification to pattern.
@@ -39,15 +145,49 @@ class DrummerModification(ABC):
         """
         pass
 
-    @property
+
+@dataclass
+class ColumnarModification(DrummerModification):
+    """Base class for modifications that only rewrite existing beats.
+
+    Subclasses change the columns of a BeatArrays snapshot in place and
+    describe the resulting pattern separately, which lets
+    ModificationPipeline run consecutive columnar steps on one set of
+    arrays.
+    """
+
+    def apply(self, pattern: Pattern, intensity: float = 1.0) -> Pattern:
+        """Apply modification to pattern through its beat columns."""
+        beats = pattern.arrays()
+        self._apply_columns(beats, intensity)
+        return self._with_beats(pattern, beats.to_beats())
+
+    @abstractmethod
+    def _apply_columns(self, beats: BeatArrays, intensity: float) -> None:
+        """Modify the beat columns in place.
+
+        Args:
+            beats: Columns of the input pattern's beats
+            intensity: Modification strength (0.0-1.0)
+        """
+        pass
+
     @abstractmethod
-    def name(self) -> str:
-        """Modification name for logging and identification."""
+    def _with_beats(self, pattern: Pattern, beats: list[Beat]) -> Pattern:
+        """Return the modified pattern holding ``beats``.
+
+        Args:
+            pattern: Input pattern, whose settings are carried over
+            beats: Modified beats
+
+        Returns:
+            Modified pattern (new instance)
+        """
         pass
 
 
 @dataclass
-class BehindBeatTiming(DrummerModification):
+class BehindBeatTiming(ColumnarModification):
     """Apply behind-the-beat timing (Bonham, Chambers style).
 
     Shifts snare hits slightly behind the beat for a laid-back feel.
@@ -60,37 +200,24 @@ class BehindBeatTiming(DrummerModification):
 
     max_delay_ms: float = 20.0  # Maximum delay in milliseconds
 
-    @property
-    def name(self) -> str:
-        return "behind_beat_timing"
+    name: ClassVar[str] = "behind_beat_timing"
 
-    def apply(self, pattern: Pattern, intensity: float = 1.0) -> Pattern:
+    def _apply_columns(self, beats: BeatArrays, intensity: float) -> None:
         """Shift snare hits slightly behind the beat."""
-        modified_beats = []
-
         # Calculate delay in beats (tempo-independent)
         # Assuming 120 BPM as baseline: delay_beats = (ms / 1000) * (BPM / 60)
         # For 20ms at 120 BPM: 0.04 beats
         delay = (self.max_delay_ms / 1000.0) * 2.0 * intensity
 
-        for beat in pattern.beats:
-            if beat.instrument == DrumInstrument.SNARE and not beat.ghost_note:
-                # Shift snare behind the beat
-                new_beat = Beat(
-                    position=beat.position + delay,
-                    instrument=beat.instrument,
-                    velocity=beat.velocity,
-                    duration=beat.duration,
-                    ghost_note=beat.ghost_note,
-                    accent=beat.accent,
-                )
-                modified_beats.append(new_beat)
-            else:
-                modified_beats.append(beat)
+        # Shift main (non-ghost) snare hits behind the beat
+        _kernels.shift_main_hits(
+            beats.positions, beats.instruments, beats.ghost_notes, _SNARE, delay
+        )
 
+    def _with_beats(self, pattern: Pattern, beats: list[Beat]) -> Pattern:
         return Pattern(
             name=f"{pattern.name}_behind_beat",
-            beats=modified_beats,
+            beats=beats,
             time_signature=pattern.time_signature,
             subdivision=pattern.subdivision,
             swing_ratio=pattern.swing_ratio,
@@ -111,56 +238,50 @@ class TripletVocabulary(DrummerModification):
 
     triplet_probability: float = 0.3
 
-    @property
-    def name(self) -> str:
-        return "triplet_vocabulary"
+    name: ClassVar[str] = "triplet_vocabulary"
 
     def apply(self, pattern: Pattern, intensity: float = 1.0) -> Pattern:
         """Add triplet-based rhythmic vocabulary."""
         modified_beats = list(pattern.beats)
 
-        # Look for opportunities to add triplets (beat 4 of each bar)
-        duration = pattern.duration_bars()
-        for bar in range(int(duration)):
-            bar_start = bar * 4.0
-
-            # Probabilistically add triplet fill on beat 4
-            if random.random() < (self.triplet_probability * intensity):
-                # Add descending triplet fill starting at beat 3.5
-                fill_start = bar_start + 3.5
-
-                # Remove any existing beats in this space
-                modified_beats = [
-                    b
-                    for b in modified_beats
-                    if not (fill_start <= b.position < bar_start + 4.0)
-                ]
-
-                # Add triplet fill (6 notes = 2 triplets)
-                instruments = [
-                    DrumInstrument.MID_TOM,
-                    DrumInstrument.MID_TOM,
-                    DrumInstrument.FLOOR_TOM,
-                    DrumInstrument.FLOOR_TOM,
-                    DrumInstrument.FLOOR_TOM,
-                    DrumInstrument.KICK,
-                ]
-
-                for i in range(6):
-                    pos = fill_start + (i * TIMING.SIXTEENTH_TRIPLET)
-                    modified_beats.append(
-                        Beat(
-                            position=pos,
-                            instrument=instruments[i],
-                            velocity=VELOCITY.TOM_HEAVY,
-                            duration=TIMING.SIXTEENTH_TRIPLET,
-                            ghost_note=False,
-                            accent=i % 3 == 0,  # Accent every 3rd
-                        )
-                    )
-
-        # Sort by position
-        modified_beats.sort(key=lambda b: b.position)
+        # Probabilistically pick bars for a triplet fill on beat 4
+        chance = self.triplet_probability * intensity
+        draws = self._generator.random(int(pattern.duration_bars()))
+        fill_bars = np.flatnonzero(draws < chance).tolist()
+
+        if fill_bars:
+            # Remove any existing beats from beat 3.5 to the end of those
+            # bars, in one pass over the pattern
+            cleared = set(fill_bars)
+            modified_beats = [
+                b
+                for b in modified_beats
+                if not (
+                    b.position % 4.0 >= 3.5
+                    and int(b.position // 4.0) in cleared
+                )
+            ]
+
+        # Add descending triplet fill starting at beat 3.5
+        # (6 notes = 2 triplets, accent every 3rd)
+        step = TIMING.SIXTEENTH_TRIPLET
+        for bar in fill_bars:
+            fill_start = bar * 4.0 + 3.5
+            modified_beats.extend(
+                Beat(
+                    fill_start + offset,
+                    instrument,
+                    velocity,
+                    step,
+                    False,  # ghost_note
+                    accent,
+                )
+                for offset, instrument, velocity, accent in _TRIPLET_FILL
+            )
+
+        # Sort by position; the fills are added in order, so a sorted input
+        # pattern leaves two runs that the sort merges in linear time
+        modified_beats.sort(key=_get_position)
 
         return Pattern(
             name=f"{pattern.name}_triplets",
@@ -185,48 +306,50 @@ class GhostNoteLayer(DrummerModification):
 
     density: float = 0.6  # How many 16ths get ghost notes
 
-    @property
-    def name(self) -> str:
-        return "ghost_note_layer"
+    name: ClassVar[str] = "ghost_note_layer"
 
     def apply(self, pattern: Pattern, intensity: float = 1.0) -> Pattern:
         """Add subtle ghost notes between main snare hits."""
         modified_beats = list(pattern.beats)
 
-        # Find main snare hit positions
-        main_snare_positions = {
-            b.position
-            for b in pattern.beats
-            if b.instrument == DrumInstrument.SNARE and not b.ghost_note
-        }
-
-        # Add ghost notes on 16ths that don't have main snares
-        duration = pattern.duration_bars()
-        for bar in range(int(duration)):
-            bar_start = bar * 4.0
-
-            for i in range(16):
-                pos = bar_start + (i * TIMING.SIXTEENTH)
-
-                # Skip if main snare already exists
-                if pos in main_snare_positions:
-                    continue
-
-                # Probabilistically add ghost note
-                if random.random() < (self.density * intensity):
-                    modified_beats.append(
-                        Beat(
-                            position=pos,
-                            instrument=DrumInstrument.SNARE,
-                            velocity=VELOCITY.SNARE_GHOST,
-                            duration=TIMING.SIXTEENTH,
-                            ghost_note=True,
-                            accent=False,
-                        )
-                    )
-
-        # Sort by position
-        modified_beats.sort(key=lambda b: b.position)
+        # Find main snare hits as 16th note indices; rounding onto the grid
+        # means hits nudged off it (e.g. behind the beat) still block their
+        # 16th, which exact float matching would miss
+        main_snare_16ths = np.rint(
+            np.fromiter(
+                (
+                    b.position
+                    for b in pattern.beats
+                    if b.instrument == DrumInstrument.SNARE and not b.ghost_note
+                ),
+                dtype=np.float64,
+            )
+            / TIMING.SIXTEENTH
+        ).astype(np.int64)
+
+        # Every 16th of every bar, minus those that have a main snare
+        bars = int(pattern.duration_bars())
+        sixteenths = np.arange(bars * 16)
+        sixteenths = sixteenths[~np.isin(sixteenths, main_snare_16ths)]
+        grid = sixteenths * TIMING.SIXTEENTH
+
+        # Probabilistically add ghost notes, one draw for all open 16ths
+        draws = self._generator.random(len(grid))
+        chosen = grid[draws < (self.density * intensity)]
+        modified_beats.extend(
+            Beat(
+                pos,
+                DrumInstrument.SNARE,
+                VELOCITY.SNARE_GHOST,
+                TIMING.SIXTEENTH,
+                True,  # ghost_note
+                False,  # accent
+            )
+            for pos in chosen.tolist()
+        )
+
+        # Sort by position; added ghost notes are already in order
+        modified_beats.sort(key=_get_position)
 
         return Pattern(
             name=f"{pattern.name}_ghost_notes",
@@ -249,50 +372,38 @@ class LinearCoordination(DrummerModification):
         LinearCoordination().apply(pattern, intensity=1.0)
     """
 
-    @property
-    def name(self) -> str:
-        return "linear_coordination"
+    name: ClassVar[str] = "linear_coordination"
 
     def apply(self, pattern: Pattern, intensity: float = 1.0) -> Pattern:
         """Remove overlapping hits to create linear patterns."""
-        from collections import defaultdict
-
-        # Group beats by position (quantize to 32nd notes)
-        position_groups = defaultdict(list)
-        for beat in pattern.beats:
-            quantized_pos = round(beat.position * 8) / 8  # 32nd note resolution
-            position_groups[quantized_pos].append(beat)
-
-        modified_beats = []
-
-        # Priority system for linear playing
-        priority = {
-            DrumInstrument.SNARE: 5,
-            DrumInstrument.KICK: 4,
-            DrumInstrument.CRASH: 3,
-            DrumInstrument.RIDE: 3,
-            DrumInstrument.MID_TOM: 2,
-            DrumInstrument.FLOOR_TOM: 2,
-            DrumInstrument.CLOSED_HH: 1,
-        }
-
-        for pos in sorted(position_groups.keys()):
-            beats = position_groups[pos]
-
-            if len(beats) == 1:
-                # Single hit - keep it
-                modified_beats.append(beats[0])
-            else:
-                # Multiple hits - apply linear logic based on intensity
-                if random.random() < intensity:
-                    # Keep only highest priority hit
-                    kept_beat = max(
-                        beats, key=lambda b: priority.get(b.instrument, 0)
-                    )
-                    modified_beats.append(kept_beat)
-                else:
-                    # Keep all hits (less linear)
-                    modified_beats.extend(beats)
+        beats = pattern.arrays()
+        # Group beats by position, quantized to 32nd notes
+        slots = np.round(beats.positions * 8).astype(np.int64)
+        priorities = _PRIORITY_TABLE[beats.instruments]
+
+        # Sort by slot, then highest priority first; the sort is stable, so
+        # ties keep pattern order and each group's first entry is its winner
+        order = np.lexsort((-priorities, slots))
+        _, starts, counts = np.unique(
+            slots[order], return_index=True, return_counts=True
+        )
+
+        # Multiple hits - apply linear logic based on intensity, keeping only
+        # the highest priority hit; otherwise keep all hits (less linear)
+        linear = np.zeros(len(starts), dtype=bool)
+        multiple = counts > 1
+        draws = self._generator.random(np.count_nonzero(multiple))
+        linear[multiple] = draws < intensity
+        losers = np.repeat(linear, counts)
+        losers[starts] = False
+        keep = np.ones(len(beats), dtype=bool)
+        keep[order[losers]] = False
+
+        # Kept beats in slot order, pattern order within each slot
+        by_slot = np.argsort(slots, kind="stable")
+        modified_beats = list(
+            map(pattern.beats.__getitem__, by_slot[keep[by_slot]].tolist())
+        )
 
         return Pattern(
             name=f"{pattern.name}_linear",
@@ -305,7 +416,7 @@ class LinearCoordination(DrummerModification):
 
 
 @dataclass
-class HeavyAccents(DrummerModification):
+class HeavyAccents(ColumnarModification):
     """Apply heavy accenting and dynamics (metal drummers).
 
     Increases the contrast between accented and non-accented hits
@@ -317,40 +428,23 @@ class HeavyAccents(DrummerModification):
 
     accent_boost: int = 15
 
-    @property
-    def name(self) -> str:
-        return "heavy_accents"
+    name: ClassVar[str] = "heavy_accents"
 
-    def apply(self, pattern: Pattern, intensity: float = 1.0) -> Pattern:
+    def _apply_columns(self, beats: BeatArrays, intensity: float) -> None:
         """Increase accent contrast for powerful feel."""
-        modified_beats = []
-
-        for beat in pattern.beats:
-            new_velocity = beat.velocity
-
-            if beat.accent:
-                # Boost accents
-                new_velocity = min(
-                    127, beat.velocity + int(self.accent_boost * intensity)
-                )
-            elif beat.ghost_note:
-                # Reduce ghost notes for more contrast
-                new_velocity = max(20, beat.velocity - int(10 * intensity))
-
-            modified_beats.append(
-                Beat(
-                    position=beat.position,
-                    instrument=beat.instrument,
-                    velocity=new_velocity,
-                    duration=beat.duration,
-                    ghost_note=beat.ghost_note,
-                    accent=beat.accent,
-                )
-            )
+        # Boost accents, and reduce ghost notes for more contrast
+        beats.velocities = _kernels.accent_contrast(
+            beats.velocities,
+            beats.accents,
+            beats.ghost_notes,
+            boost=int(self.accent_boost * intensity),
+            cut=int(10 * intensity),
+        )
 
+    def _with_beats(self, pattern: Pattern, beats: list[Beat]) -> Pattern:
         return Pattern(
             name=f"{pattern.name}_heavy_accents",
-            beats=modified_beats,
+            beats=beats,
             time_signature=pattern.time_signature,
             subdivision=pattern.subdivision,
             swing_ratio=pattern.swing_ratio,
@@ -359,7 +453,7 @@ class HeavyAccents(DrummerModification):
 
 
 @dataclass
-class ShuffleFeelApplication(DrummerModification):
+class ShuffleFeelApplication(ColumnarModification):
     """Apply shuffle feel (Porcaro's half-time shuffle).
 
     Converts straight 16ths to shuffle feel with triplet-based swing.
@@ -370,43 +464,23 @@ class ShuffleFeelApplication(DrummerModification):
 
     shuffle_amount: float = 0.33  # 0.33 = triplet feel
 
-    @property
-    def name(self) -> str:
-        return "shuffle_feel"
+    name: ClassVar[str] = "shuffle_feel"
 
-    def apply(self, pattern: Pattern, intensity: float = 1.0) -> Pattern:
+    def _apply_columns(self, beats: BeatArrays, intensity: float) -> None:
         """Apply shuffle/swing feel to straight notes."""
-        modified_beats = []
-
-        for beat in pattern.beats:
-            # Apply shuffle to off-beat 16ths (positions x.25, x.75, etc.)
-            beat_within_quarter = beat.position % 1.0
-            is_offbeat_16th = (
-                abs(beat_within_quarter - 0.25) < 0.01
-                or abs(beat_within_quarter - 0.75) < 0.01
-            )
+        # Off-beat 16ths sit at x.25 and x.75 within each quarter note
+        within_quarter = np.mod(beats.positions, 1.0)
+        offbeat_16ths = (np.abs(within_quarter - 0.25) < 0.01) | (
+            np.abs(within_quarter - 0.75) < 0.01
+        )
 
-            if is_offbeat_16th:
-                # Push offbeat notes later (shuffle feel)
-                swing_amount = self.shuffle_amount * 0.25 * intensity
-                new_position = beat.position + swing_amount
-
-                modified_beats.append(
-                    Beat(
-                        position=new_position,
-                        instrument=beat.instrument,
-                        velocity=beat.velocity,
-                        duration=beat.duration,
-                        ghost_note=beat.ghost_note,
-                        accent=beat.accent,
-                    )
-                )
-            else:
-                modified_beats.append(beat)
+        # Push offbeat notes later (shuffle feel)
+        beats.positions[offbeat_16ths] += self.shuffle_amount * 0.25 * intensity
 
+    def _with_beats(self, pattern: Pattern, beats: list[Beat]) -> Pattern:
         return Pattern(
             name=f"{pattern.name}_shuffle",
-            beats=modified_beats,
+            beats=beats,
             time_signature=pattern.time_signature,
             subdivision=pattern.subdivision,
             swing_ratio=max(pattern.swing_ratio, self.shuffle_amount),
@@ -426,43 +500,32 @@ class FastChopsTriplets(DrummerModification):
 
     probability: float = 0.25
 
-    @property
-    def name(self) -> str:
-        return "fast_chops_triplets"
+    name: ClassVar[str] = "fast_chops_triplets"
 
     def apply(self, pattern: Pattern, intensity: float = 1.0) -> Pattern:
         """Add fast triplet-based technical fills."""
         modified_beats = list(pattern.beats)
 
-        duration = pattern.duration_bars()
-        for bar in range(int(duration)):
-            bar_start = bar * 4.0
-
-            # Add fast chops on beat 3 occasionally
-            if random.random() < (self.probability * intensity):
-                chop_start = bar_start + 2.5
-
-                # Fast triplet snare roll
-                for i in range(6):
-                    pos = chop_start + (i * TIMING.SIXTEENTH_TRIPLET)
-                    velocity = (
-                        VELOCITY.SNARE_HEAVY
-                        if i % 2 == 0
-                        else VELOCITY.SNARE_NORMAL
-                    )
-
-                    modified_beats.append(
-                        Beat(
-                            position=pos,
-                            instrument=DrumInstrument.SNARE,
-                            velocity=velocity,
-                            duration=TIMING.SIXTEENTH_TRIPLET,
-                            ghost_note=False,
-                            accent=i == 0,
-                        )
-                    )
-
-        modified_beats.sort(key=lambda b: b.position)
+        chance = self.probability * intensity
+        draws = self._generator.random(int(pattern.duration_bars()))
+        step = TIMING.SIXTEENTH_TRIPLET
+        # Add fast chops on beat 3 occasionally: a triplet snare roll
+        # alternating heavy and normal hits, accenting the first
+        for bar in np.flatnonzero(draws < chance).tolist():
+            chop_start = bar * 4.0 + 2.5
+            modified_beats.extend(
+                Beat(
+                    chop_start + offset,
+                    instrument,
+                    velocity,
+                    step,
+                    False,  # ghost_note
+                    accent,
+                )
+                for offset, instrument, velocity, accent in _CHOPS_FILL
+            )
+
+        modified_beats.sort(key=_get_position)
 
         return Pattern(
             name=f"{pattern.name}_fast_chops",
@@ -475,7 +538,7 @@ class FastChopsTriplets(DrummerModification):
 
 
 @dataclass
-class PocketStretching(DrummerModification):
+class PocketStretching(ColumnarModification):
     """Apply pocket stretching (Chambers funk mastery).
 
     Subtle timing variations that create groove tension and release.
@@ -486,40 +549,27 @@ class PocketStretching(DrummerModification):
 
     variation_ms: float = 5.0
 
-    @property
-    def name(self) -> str:
-        return "pocket_stretching"
+    name: ClassVar[str] = "pocket_stretching"
 
-    def apply(self, pattern: Pattern, intensity: float = 1.0) -> Pattern:
+    def _apply_columns(self, beats: BeatArrays, intensity: float) -> None:
         """Apply subtle pocket variations for groove."""
-        modified_beats = []
-
         variation = (self.variation_ms / 1000.0) * 2.0 * intensity
 
-        for beat in pattern.beats:
-            # Apply random pocket variation to hi-hats and ghost notes
-            if beat.instrument == DrumInstrument.CLOSED_HH or beat.ghost_note:
-                offset = random.uniform(-variation, variation)
-                new_position = max(
-                    0.0, beat.position + offset
-                )  # Clamp to non-negative
-
-                modified_beats.append(
-                    Beat(
-                        position=new_position,
-                        instrument=beat.instrument,
-                        velocity=beat.velocity,
-                        duration=beat.duration,
-                        ghost_note=beat.ghost_note,
-                        accent=beat.accent,
-                    )
-                )
-            else:
-                modified_beats.append(beat)
+        # Apply random pocket variation to hi-hats and ghost notes, one
+        # draw for all of them
+        pocket = (beats.instruments == _CLOSED_HH) | beats.ghost_notes
+        offsets = self._generator.uniform(
+            -variation, variation, np.count_nonzero(pocket)
+        )
+        # Clamp to non-negative
+        beats.positions[pocket] = np.maximum(
+            0.0, beats.positions[pocket] + offsets
+        )
 
+    def _with_beats(self, pattern: Pattern, beats: list[Beat]) -> Pattern:
         return Pattern(
             name=f"{pattern.name}_pocket",
-            beats=modified_beats,
+            beats=beats,
             time_signature=pattern.time_signature,
             subdivision=pattern.subdivision,
             swing_ratio=pattern.swing_ratio,
@@ -539,29 +589,21 @@ class MinimalCreativity(DrummerModification):
 
     sparseness: float = 0.6  # Higher = more sparse
 
-    @property
-    def name(self) -> str:
-        return "minimal_creativity"
+    name: ClassVar[str] = "minimal_creativity"
 
     def apply(self, pattern: Pattern, intensity: float = 1.0) -> Pattern:
         """Remove non-essential hits for minimal feel."""
-        modified_beats = []
-
         # Keep kick and snare, thin out cymbals
-        for beat in pattern.beats:
-            is_cymbal = beat.instrument in [
-                DrumInstrument.CLOSED_HH,
-                DrumInstrument.OPEN_HH,
-                DrumInstrument.RIDE,
-            ]
-
-            if is_cymbal:
-                # Probabilistically remove cymbal hits
-                if random.random() > (self.sparseness * intensity):
-                    modified_beats.append(beat)
-            else:
-                # Keep drums
-                modified_beats.append(beat)
+        keep = np.ones(len(pattern.beats), dtype=bool)
+        cymbals = np.fromiter(
+            (beat.instrument in _THINNED_CYMBALS for beat in pattern.beats),
+            dtype=bool,
+            count=len(pattern.beats),
+        )
+        # Probabilistically remove cymbal hits
+        draws = self._generator.random(np.count_nonzero(cymbals))
+        keep[cymbals] = draws > (self.sparseness * intensity)
+        modified_beats = list(compress(pattern.beats, keep.tolist()))
 
         return Pattern(
             name=f"{pattern.name}_minimal",
@@ -574,7 +616,7 @@ class MinimalCreativity(DrummerModification):
 
 
 @dataclass
-class SpeedPrecision(DrummerModification):
+class SpeedPrecision(ColumnarModification):
     """Apply speed and precision (Dee style).
 
     Ensures consistent velocities and tight timing for precision feel.
@@ -585,42 +627,22 @@ class SpeedPrecision(DrummerModification):
 
     consistency: float = 0.9  # 0-1, higher = more consistent
 
-    @property
-    def name(self) -> str:
-        return "speed_precision"
+    name: ClassVar[str] = "speed_precision"
 
-    def apply(self, pattern: Pattern, intensity: float = 1.0) -> Pattern:
+    def _apply_columns(self, beats: BeatArrays, intensity: float) -> None:
         """Apply mechanical precision to timing and velocities."""
-        modified_beats = []
-
-        for beat in pattern.beats:
-            # Reduce velocity variation
-            target_velocity = {
-                DrumInstrument.KICK: VELOCITY.KICK_HEAVY,
-                DrumInstrument.SNARE: VELOCITY.SNARE_HEAVY,
-                DrumInstrument.CLOSED_HH: VELOCITY.HIHAT_NORMAL,
-            }.get(beat.instrument, beat.velocity)
-
-            # Blend current velocity with target
-            blend = self.consistency * intensity
-            new_velocity = int(
-                beat.velocity * (1 - blend) + target_velocity * blend
-            )
-
-            modified_beats.append(
-                Beat(
-                    position=beat.position,  # Keep timing precise
-                    instrument=beat.instrument,
-                    velocity=new_velocity,
-                    duration=beat.duration,
-                    ghost_note=beat.ghost_note,
-                    accent=beat.accent,
-                )
-            )
+        # Reduce velocity variation, blending towards each target; timing is
+        # kept precise
+        targets = _SPEED_TARGETS[beats.instruments]
+        np.copyto(targets, beats.velocities, where=targets < 0)
+        beats.velocities = _kernels.blend_velocities(
+            beats.velocities, targets, self.consistency * intensity
+        )
 
+    def _with_beats(self, pattern: Pattern, beats: list[Beat]) -> Pattern:
         return Pattern(
             name=f"{pattern.name}_precision",
-            beats=modified_beats,
+            beats=beats,
             time_signature=pattern.time_signature,
             subdivision=pattern.subdivision,
             swing_ratio=pattern.swing_ratio,
@@ -629,7 +651,7 @@ class SpeedPrecision(DrummerModification):
 
 
 @dataclass
-class TwistedAccents(DrummerModification):
+class TwistedAccents(ColumnarModification):
     """Apply twisted/displaced accents (Dee style).
 
     Moves accents to unexpected positions for interest.
@@ -640,46 +662,24 @@ class TwistedAccents(DrummerModification):
 
     displacement: float = 0.5  # Probability of displacing accent
 
-    @property
-    def name(self) -> str:
-        return "twisted_accents"
+    name: ClassVar[str] = "twisted_accents"
 
-    def apply(self, pattern: Pattern, intensity: float = 1.0) -> Pattern:
+    def _apply_columns(self, beats: BeatArrays, intensity: float) -> None:
         """Displace accents to unexpected positions."""
-        modified_beats = []
-
-        for _i, beat in enumerate(pattern.beats):
-            new_accent = beat.accent
-
-            # Probabilistically move accents
-            if beat.accent and random.random() < (
-                self.displacement * intensity
-            ):
-                # Remove this accent
-                new_accent = False
-
-            # Add accent to unexpected beat
-            if (
-                not beat.accent
-                and beat.instrument == DrumInstrument.SNARE
-                and random.random() < (self.displacement * intensity * 0.3)
-            ):
-                new_accent = True
-
-            modified_beats.append(
-                Beat(
-                    position=beat.position,
-                    instrument=beat.instrument,
-                    velocity=beat.velocity,
-                    duration=beat.duration,
-                    ghost_note=beat.ghost_note,
-                    accent=new_accent,
-                )
-            )
+        chance = self.displacement * intensity
+
+        # One draw per beat: accented beats lose their accent, and unaccented
+        # snares gain one, each with its own probability
+        draws = self._generator.random(len(beats))
+        snares = beats.instruments == _SNARE
+        beats.accents = np.where(
+            beats.accents, draws >= chance, snares & (draws < chance * 0.3)
+        )
 
+    def _with_beats(self, pattern: Pattern, beats: list[Beat]) -> Pattern:
         return Pattern(
             name=f"{pattern.name}_twisted",
-            beats=modified_beats,
+            beats=beats,
             time_signature=pattern.time_signature,
             subdivision=pattern.subdivision,
             swing_ratio=pattern.swing_ratio,
@@ -688,7 +688,7 @@ class TwistedAccents(DrummerModification):
 
 
 @dataclass
-class MechanicalPrecision(DrummerModification):
+class MechanicalPrecision(ColumnarModification):
     """Apply mechanical precision (Hoglan style).
 
     Extremely consistent timing and velocities for machine-like feel.
@@ -699,48 +699,26 @@ class MechanicalPrecision(DrummerModification):
 
     quantize_amount: float = 0.95  # 0-1, higher = more quantized
 
-    @property
-    def name(self) -> str:
-        return "mechanical_precision"
+    name: ClassVar[str] = "mechanical_precision"
 
-    def apply(self, pattern: Pattern, intensity: float = 1.0) -> Pattern:
+    def _apply_columns(self, beats: BeatArrays, intensity: float) -> None:
         """Apply extreme quantization and consistency."""
-        modified_beats = []
-
-        for beat in pattern.beats:
-            # Quantize position to grid
-            grid = TIMING.THIRTY_SECOND  # 32nd note grid
-            quantized_pos = round(beat.position / grid) * grid
-
-            # Blend original and quantized
-            blend = self.quantize_amount * intensity
-            new_position = beat.position * (1 - blend) + quantized_pos * blend
-
-            # Normalize velocities
-            velocity_target = {
-                DrumInstrument.KICK: VELOCITY.KICK_HEAVY,
-                DrumInstrument.SNARE: VELOCITY.SNARE_HEAVY,
-            }.get(beat.instrument, beat.velocity)
-
-            new_velocity = int(
-                beat.velocity * (1 - blend * 0.5)
-                + velocity_target * blend * 0.5
-            )
+        blend = self.quantize_amount * intensity
 
-            modified_beats.append(
-                Beat(
-                    position=new_position,
-                    instrument=beat.instrument,
-                    velocity=new_velocity,
-                    duration=beat.duration,
-                    ghost_note=beat.ghost_note,
-                    accent=beat.accent,
-                )
-            )
+        # Quantize positions to a 32nd note grid and blend with the originals
+        _kernels.quantize_blend(beats.positions, TIMING.THIRTY_SECOND, blend)
 
+        # Normalize kick and snare velocities towards heavy hits
+        targets = _MECHANICAL_TARGETS[beats.instruments]
+        np.copyto(targets, beats.velocities, where=targets < 0)
+        beats.velocities = _kernels.blend_velocities(
+            beats.velocities, targets, blend * 0.5
+        )
+
+    def _with_beats(self, pattern: Pattern, beats: list[Beat]) -> Pattern:
         return Pattern(
             name=f"{pattern.name}_mechanical",
-            beats=modified_beats,
+            beats=beats,
             time_signature=pattern.time_signature,
             subdivision=pattern.subdivision,
             swing_ratio=pattern.swing_ratio,
@@ -748,6 +726,77 @@ class MechanicalPrecision(DrummerModification):
         )
 
 
+@dataclass
+class ModificationPipeline:
+    """Chain of modifications applied in order, as one call.
+
+    The result matches applying each step's modification in turn, but
+    consecutive ColumnarModification steps share one set of beat arrays:
+    the beats are converted to arrays once before such a run and back to
+    Beat objects once after it, instead of once per step.
+
+    Example:
+        ModificationPipeline(
+            [(MechanicalPrecision(), 1.0), (HeavyAccents(), 0.9)]
+        ).apply(pattern)
+    """
+
+    steps: Sequence[tuple[DrummerModification, float]]
+
+    def apply(self, pattern: Pattern) -> Pattern:
+        """Apply every step to pattern.
+
+        Args:
+            pattern: Input pattern to modify
+
+        Returns:
+            Modified pattern (new instance, original unchanged)
+        """
+        if not self.steps:
+            return pattern.copy()
+        beats: BeatArrays | None = None
+        for modification, intensity in self.steps:
+            if isinstance(modification, ColumnarModification):
+                if beats is None:
+                    beats = pattern.arrays()
+                modification._apply_columns(beats, intensity)
+                # Carry the pattern settings forward; beats are filled in
+                # once the run of columnar steps ends
+                pattern = modification._with_beats(pattern, [])
+                continue
+            if beats is not None:
+                pattern.beats = beats.to_beats()
+                beats = None
+            pattern = modification.apply(pattern, intensity)
+
+        if beats is not None:
+            pattern.beats = beats.to_beats()
+        return pattern
+
+
+# Standard modifications keyed by their ``name``, built once at import
+_BY_NAME: dict[str, type[DrummerModification]] = {
+    mod_class.name: mod_class
+    for mod_class in (
+        BehindBeatTiming,
+        TripletVocabulary,
+        GhostNoteLayer,
+        LinearCoordination,
+        HeavyAccents,
+        ShuffleFeelApplication,
+        FastChopsTriplets,
+        PocketStretching,
+        MinimalCreativity,
+        SpeedPrecision,
+        TwistedAccents,
+        MechanicalPrecision,
+    )
+}
+
+# Read-only view of the standard modifications by name
+MODIFICATIONS_BY_NAME = MappingProxyType(_BY_NAME)
+
+
 class ModificationRegistry:
     """Registry of available drummer modifications.
 
@@ -760,18 +809,7 @@ class ModificationRegistry:
 
     def _register_defaults(self):
         """Register all standard modifications."""
-        self.register(BehindBeatTiming)
-        self.register(TripletVocabulary)
-        self.register(GhostNoteLayer)
-        self.register(LinearCoordination)
-        self.register(HeavyAccents)
-        self.register(ShuffleFeelApplication)
-        self.register(FastChopsTriplets)
-        self.register(PocketStretching)
-        self.register(MinimalCreativity)
-        self.register(SpeedPrecision)
-        self.register(TwistedAccents)
-        self.register(MechanicalPrecision)
+        self._modifications.update(_BY_NAME)
 
     def register(self, mod_class: type[DrummerModification]):
         """Register a modification class.
@@ -779,9 +817,7 @@ class ModificationRegistry:
         Args:
             mod_class: DrummerModification subclass to register
         """
-        # Create temporary instance to get name
-        instance = mod_class()
-        self._modifications[instance.name] = mod_class
+        self._modifications[mod_class.name] = mod_class
 
     def get(self, name: str) -> type[DrummerModification] | None:
         """Get modification class by name.
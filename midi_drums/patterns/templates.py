@@ -10,6 +10,8 @@ import random
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 
+import numpy as np
+
 from midi_drums.config import TIMING, VELOCITY
 from midi_drums.models.pattern import DrumInstrument, Pattern, PatternBuilder
 
@@ -73,21 +75,23 @@ class BasicGroove(PatternTemplate):
             velocity = min(127, velocity)
             builder.snare(pos, velocity)
 
-        # Add hi-hat pattern
+        # Add hi-hat pattern: every subdivision of every bar, in order
         bars = kwargs.get("bars", 1)
-        for bar in range(bars):
-            bar_offset = bar * 4.0
-            beats_per_bar = int(4.0 / self.hihat_subdivision)
-
-            for i in range(beats_per_bar):
-                pos = bar_offset + (i * self.hihat_subdivision)
-
-                # Check if this position should be open hihat
-                if self.use_open_hihat and pos in self.open_hihat_positions:
-                    builder.open_hihat(pos, VELOCITY.HIHAT_OPEN)
-                else:
-                    velocity = VELOCITY.HIHAT_NORMAL
-                    builder.hihat(pos, velocity)
+        beats_per_bar = int(4.0 / self.hihat_subdivision)
+        positions = (
+            np.arange(bars)[:, None] * 4.0
+            + np.arange(beats_per_bar) * self.hihat_subdivision
+        ).ravel()
+
+        # Check which positions should be open hihat
+        if self.use_open_hihat:
+            open_mask = np.isin(positions, self.open_hihat_positions)
+        else:
+            open_mask = np.zeros(len(positions), dtype=bool)
+        velocities = np.where(
+            open_mask, VELOCITY.HIHAT_OPEN, VELOCITY.HIHAT_NORMAL
+        )
+        builder.hihats(positions, velocities, open_mask)
 
         return builder
 
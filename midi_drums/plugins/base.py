@@ -3,10 +3,11 @@
 import importlib
 import logging
 import pkgutil
+import random
 from abc import ABC, abstractmethod
 from pathlib import Path
 
-from midi_drums.models.pattern import Pattern
+from midi_drums.models.pattern import Beat, DrumInstrument, Pattern
 from midi_drums.models.song import Fill, GenerationParameters
 
 logger = logging.getLogger(__name__)
@@ -101,8 +102,6 @@ class GenrePlugin(ABC):
             - Context: metal's high aggression and power
             - Result: Complex progressive with heavier, more aggressive feel
         """
-        from midi_drums.models.pattern import DrumInstrument
-
         if blend_amount <= 0.0:
             return pattern
 
@@ -151,8 +150,6 @@ class GenrePlugin(ABC):
             ) * blend_amount
             if density_increase > 0.2:
                 # Add subtle ghost notes between main snare hits
-                import random
-
                 new_beats = []
                 snare_positions = [
                     b.position
@@ -162,8 +159,6 @@ class GenrePlugin(ABC):
                 for pos in snare_positions:
                     if random.random() < density_increase:
                         # Add ghost note before main hit
-                        from midi_drums.models.pattern import Beat
-
                         ghost = Beat(
                             position=max(0, pos - 0.125),
                             instrument=DrumInstrument.SNARE,
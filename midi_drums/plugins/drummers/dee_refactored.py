@@ -7,6 +7,7 @@ DrummerModification system instead of manual pattern manipulation.
 from midi_drums.models.pattern import Pattern
 from midi_drums.models.song import Fill
 from midi_drums.modifications import (
+    ModificationPipeline,
     SpeedPrecision,
     TwistedAccents,
 )
@@ -30,6 +31,9 @@ class DeePlugin(DrummerPlugin):
     def __init__(self):
         self.precision = SpeedPrecision(consistency=0.95)
         self.twisted = TwistedAccents(displacement=0.25)
+        self.pipeline = ModificationPipeline(
+            [(self.precision, 0.9), (self.twisted, 0.7)]
+        )
 
     @property
     def drummer_name(self) -> str:
@@ -44,10 +48,7 @@ class DeePlugin(DrummerPlugin):
         styled = pattern.copy()
         styled.name = f"{pattern.name}_dee"
 
-        styled = self.precision.apply(styled, intensity=0.9)
-        styled = self.twisted.apply(styled, intensity=0.7)
-
-        return styled
+        return self.pipeline.apply(styled)
 
     def get_signature_fills(self) -> list[Fill]:
         """Return Mikkey Dee's signature fill patterns."""
@@ -9,6 +9,7 @@ from midi_drums.models.song import Fill
 from midi_drums.modifications import (
     HeavyAccents,
     MechanicalPrecision,
+    ModificationPipeline,
 )
 from midi_drums.plugins.base import DrummerPlugin
 
@@ -30,6 +31,9 @@ class HoglanPlugin(DrummerPlugin):
     def __init__(self):
         self.precision = MechanicalPrecision(quantize_amount=0.98)
         self.accents = HeavyAccents(accent_boost=18)
+        self.pipeline = ModificationPipeline(
+            [(self.precision, 1.0), (self.accents, 0.9)]
+        )
 
     @property
     def drummer_name(self) -> str:
@@ -44,10 +48,7 @@ class HoglanPlugin(DrummerPlugin):
         styled = pattern.copy()
         styled.name = f"{pattern.name}_hoglan"
 
-        styled = self.precision.apply(styled, intensity=1.0)
-        styled = self.accents.apply(styled, intensity=0.9)
-
-        return styled
+        return self.pipeline.apply(styled)
 
     def get_signature_fills(self) -> list[Fill]:
         """Return Gene Hoglan's signature fill patterns."""
@@ -0,0 +1,36 @@
+"""Small bounded caches shared by the models and the engine."""
+
+from collections.abc import Callable, Hashable
+from typing import TypeVar
+
+V = TypeVar("V")
+
+
+def get_or_create(
+    cache: dict[Hashable, V],
+    key: Hashable,
+    factory: Callable[[], V],
+    limit: int,
+) -> V:
+    """Return ``cache[key]``, building and storing it on a miss.
+
+    Once ``limit`` entries are stored, the oldest is evicted first (dicts
+    keep insertion order). Keys may be built from ``id()`` as long as each
+    value keeps the keyed object alive: its id then cannot be reused by
+    another object while the entry exists.
+
+    Args:
+        cache: Dict used as the cache
+        key: Cache key
+        factory: Builds the value on a miss
+        limit: Maximum number of entries
+
+    Returns:
+        The cached or newly built value
+    """
+    value = cache.get(key)
+    if value is None:
+        if len(cache) >= limit:
+            del cache[next(iter(cache))]
+        value = cache[key] = factory()
+    return value
@@ -160,6 +160,22 @@ class TestReaperEngine:
         assert markers[0].marker_id == 1
         assert markers[1].marker_id == 2
 
+    def test_marker_auto_id_continues_after_existing(self):
+        """Test auto-assigned IDs follow markers already in the project."""
+        engine = ReaperEngine()
+        project = engine.create_minimal_project()
+
+        engine.add_markers(project, [Marker(0.0, "Intro", marker_id=1)])
+        markers = [
+            Marker(8.0, "Verse"),
+            Marker(16.0, "Chorus", marker_id=7),
+            Marker(24.0, "Outro"),
+        ]
+        engine.add_markers(project, markers)
+
+        assert markers[0].marker_id == 2
+        assert markers[2].marker_id == 4
+
     def test_save_and_load_project(self, tmp_path):
         """Test saving and loading project."""
         engine = ReaperEngine()
@@ -468,6 +484,16 @@ class TestSectionColors:
         assert get_section_color("VERSE") == get_section_color("verse")
         assert get_section_color("Chorus") == get_section_color("chorus")
 
+    def test_marker_color_in_reaper_format(self):
+        """Hex colors are written as Reaper 0x01BBGGRR integers."""
+        row = Marker(8.0, "Verse", "#0066CC", marker_id=2).to_rpp_list()
+        assert row[4] == str(0x01CC6600)
+
+    def test_marker_color_fallbacks(self):
+        """Integer colors pass through and invalid hex disables color."""
+        assert Marker(0.0, "A", 16777216).to_rpp_list()[4] == "16777216"
+        assert Marker(0.0, "B", "not-a-color").to_rpp_list()[4] == "0"
+
 
 class TestGenreStructurePreset:
     """Test GenreStructurePreset model."""
@@ -1,5 +1,6 @@
 """Unit tests for advanced humanization system."""
 
+import numpy as np
 import pytest
 
 from midi_drums.humanization import AdvancedHumanizer
@@ -94,6 +95,9 @@ class TestAdvancedHumanizerInit:
         assert tight.multiplier == 0.5
         assert balanced.multiplier == 1.0
         assert loose.multiplier == 1.8
+        assert loose.style_multipliers["tight"] == 0.5
+        with pytest.raises(TypeError):
+            loose.style_multipliers["tight"] = 2.0
 
     def test_tempo_affects_ms_per_beat(self):
         """Test that tempo correctly calculates ms per beat."""
@@ -105,6 +109,13 @@ class TestAdvancedHumanizerInit:
         assert h_120.ms_per_beat == 500.0  # 120 BPM = 2 beats per second
         assert h_240.ms_per_beat == 250.0  # 240 BPM = 4 beats per second
 
+    def test_seed_makes_humanization_reproducible(self, simple_pattern):
+        """Test that humanizers with the same seed produce the same output."""
+        first = AdvancedHumanizer(seed=42).humanize_pattern(simple_pattern)
+        second = AdvancedHumanizer(seed=42).humanize_pattern(simple_pattern)
+
+        assert first.beats == second.beats
+
 
 class TestBasicHumanization:
     """Test basic humanization functionality."""
@@ -328,6 +339,32 @@ class TestMicroTiming:
             assert crash.position >= 0.0
             assert kick.position >= 0.0
 
+    def test_near_simultaneous_beats_grouped_across_grid_edges(self):
+        """Test that beats a few ms apart share a group wherever they fall."""
+        humanizer = AdvancedHumanizer(tempo=120)
+        positions = np.array([0.999, 1.001, 2.0, 1.5])
+
+        group_ids, group_positions = humanizer._group_beats_by_timing(
+            positions, np.zeros(4, dtype=np.intp)
+        )
+
+        assert group_ids[0] == group_ids[1]
+        assert len(set(group_ids.tolist())) == 3
+        assert group_positions.tolist() == [0.999, 0.999, 2.0, 1.5]
+
+    def test_closely_spaced_hits_do_not_chain_into_one_group(self):
+        """Test that groups span at most 10ms from their earliest beat."""
+        humanizer = AdvancedHumanizer(tempo=120)
+        # Three hits 7.5ms apart, spanning 15ms at 120 BPM (0.02 beats = 10ms)
+        positions = np.array([0.0, 0.015, 0.03, 1.0, 1.015])
+
+        group_ids, group_positions = humanizer._group_beats_by_timing(
+            positions, np.array([0, 0, 0, 0, 1])
+        )
+
+        assert group_ids.tolist() == [0, 0, 1, 2, 3]
+        assert group_positions.tolist() == [0.0, 0.0, 0.03, 1.0, 1.015]
+
 
 class TestFatigue:
     """Test fatigue modeling."""
@@ -394,6 +431,56 @@ class TestStyleVariations:
         ), "Loose should have more timing variation"
 
 
+class TestBatchHumanization:
+    """Test humanizing several patterns in one call."""
+
+    def test_humanize_many_keeps_order_and_counts(
+        self, simple_pattern, pattern_with_accents
+    ):
+        """Test that each result matches its input pattern."""
+        humanizer = AdvancedHumanizer(humanization_amount=0.5)
+
+        results = humanizer.humanize_many(
+            [simple_pattern, pattern_with_accents], ["verse", "chorus"]
+        )
+
+        assert [p.name for p in results] == [
+            "test_pattern_humanized",
+            "test_accents_humanized",
+        ]
+        assert len(results[0].beats) == len(simple_pattern.beats)
+        assert len(results[1].beats) == len(pattern_with_accents.beats)
+        for result in results:
+            positions = [b.position for b in result.beats]
+            assert positions == sorted(positions)
+
+    def test_humanize_many_matches_single_pattern_seeded(self, simple_pattern):
+        """Test that a batch of one matches humanize_pattern."""
+        single = AdvancedHumanizer(seed=7).humanize_pattern(simple_pattern)
+        batch = AdvancedHumanizer(seed=7).humanize_many([simple_pattern])
+
+        assert batch[0].beats == single.beats
+
+    def test_humanize_many_passes_empty_patterns_through(self, simple_pattern):
+        """Test that patterns without beats are returned unchanged."""
+        empty = Pattern("empty", beats=[])
+        humanizer = AdvancedHumanizer()
+
+        results = humanizer.humanize_many([empty, simple_pattern])
+
+        assert results[0] is empty
+        assert results[1] is not simple_pattern
+
+    def test_humanize_many_rejects_mismatched_section_types(
+        self, simple_pattern
+    ):
+        """Test that section types must line up with patterns."""
+        humanizer = AdvancedHumanizer()
+
+        with pytest.raises(ValueError):
+            humanizer.humanize_many([simple_pattern], ["verse", "chorus"])
+
+
 class TestEdgeCases:
     """Test edge cases and error handling."""
 
@@ -406,6 +493,12 @@ class TestEdgeCases:
         humanized = humanizer.humanize_pattern(empty)
         assert len(humanized.beats) == 0
 
+    def test_negligible_amount_returns_unchanged(self, simple_pattern):
+        """Test that a vanishingly small amount is treated as zero."""
+        humanizer = AdvancedHumanizer(humanization_amount=1e-5)
+
+        assert humanizer.humanize_pattern(simple_pattern) is simple_pattern
+
     def test_single_beat_pattern(self):
         """Test humanization on pattern with single beat."""
         single = Pattern("single", beats=[Beat(0.0, DrumInstrument.KICK, 100)])
@@ -0,0 +1,112 @@
+"""Unit tests for drum kit configuration."""
+
+import sys
+from dataclasses import FrozenInstanceError
+
+import pytest
+
+from midi_drums.models.kit import DrumKit, VelocityRange
+from midi_drums.models.pattern import DrumInstrument
+
+
+class TestVelocityRange:
+    """Test instrument to velocity range lookup."""
+
+    def test_validation(self):
+        """Test that out-of-range or inverted ranges are rejected."""
+        with pytest.raises(ValueError):
+            VelocityRange(0, 100, 50)
+        with pytest.raises(ValueError):
+            VelocityRange(100, 90, 95)
+
+    def test_immutable(self):
+        """Test that ranges cannot be modified in place."""
+        with pytest.raises(FrozenInstanceError):
+            DrumKit().get_velocity_range(DrumInstrument.KICK).min_velocity = 1
+
+    def test_instrument_categories(self):
+        """Test that instruments resolve to their category's range."""
+        kit = DrumKit.create_metal_kit()
+
+        assert kit.get_velocity_range(DrumInstrument.RIM) is (
+            kit.velocity_ranges["snare"]
+        )
+        assert kit.get_velocity_range(DrumInstrument.PEDAL_HH) is (
+            kit.velocity_ranges["hihat"]
+        )
+        assert kit.get_velocity_range(DrumInstrument.RIDE_BELL) is (
+            kit.velocity_ranges["ride"]
+        )
+
+    def test_missing_category_uses_full_range(self):
+        """Test the default range when the kit lacks a category."""
+        kit = DrumKit(velocity_ranges={})
+
+        velocity_range = kit.get_velocity_range(DrumInstrument.KICK)
+
+        assert velocity_range.min_velocity == 1
+        assert velocity_range.max_velocity == 127
+
+    def test_runtime_built_keys_are_interned(self):
+        """Test that category keys built at runtime are interned."""
+        key = "".join(["sna", "re"])
+        kit = DrumKit(velocity_ranges={key: VelocityRange(50, 60, 55)})
+
+        (stored_key,) = kit.velocity_ranges
+        assert stored_key is sys.intern("snare")
+        assert kit.get_velocity_range(DrumInstrument.SNARE).max_velocity == 60
+
+    def test_non_string_key_rejected(self):
+        """Test that a non-category key is named in the error."""
+        with pytest.raises(TypeError, match="DrumInstrument.KICK"):
+            DrumKit(
+                velocity_ranges={DrumInstrument.KICK: VelocityRange(50, 60, 55)}
+            )
+
+
+class TestRandomizeVelocity:
+    """Test randomized velocities drawn from kit ranges."""
+
+    def test_velocities_within_range(self):
+        """Test that randomized velocities respect the category range."""
+        kit = DrumKit()
+
+        velocities = {
+            kit.randomize_velocity(DrumInstrument.KICK) for _ in range(3000)
+        }
+
+        assert min(velocities) >= 95
+        assert max(velocities) <= 120
+        assert all(isinstance(v, int) for v in velocities)
+
+    def test_follows_range_changes(self):
+        """Test that editing a range takes effect on the next draw."""
+        kit = DrumKit()
+        kit.randomize_velocity(DrumInstrument.SNARE)
+
+        kit.velocity_ranges["snare"] = VelocityRange(10, 10, 10)
+
+        assert kit.randomize_velocity(DrumInstrument.SNARE) == 10
+
+
+class TestPresets:
+    """Test kit presets."""
+
+    def test_from_preset_is_case_insensitive(self):
+        """Test that preset names resolve regardless of case."""
+        assert DrumKit.from_preset("Metal").name == "Metal Kit"
+        assert DrumKit.from_preset("GM").name == "General MIDI Drums"
+
+    def test_unknown_preset(self):
+        """Test that unknown presets list the available names."""
+        with pytest.raises(ValueError, match="Available presets: .*jazz"):
+            DrumKit.from_preset("cowbell")
+
+    def test_preset_kits_are_independent(self):
+        """Test that editing one kit's ranges leaves new kits untouched."""
+        kit = DrumKit.from_preset("jazz")
+        kit.velocity_ranges["kick"] = VelocityRange(1, 1, 1)
+
+        fresh = DrumKit.from_preset("jazz")
+
+        assert fresh.velocity_ranges["kick"] == VelocityRange(70, 100, 85)
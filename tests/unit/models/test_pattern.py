@@ -0,0 +1,244 @@
+"""Unit tests for pattern data models."""
+
+from dataclasses import fields
+
+import numpy as np
+import pytest
+
+from midi_drums.models.pattern import (
+    Beat,
+    BeatArrays,
+    DrumInstrument,
+    Pattern,
+    PatternBuilder,
+)
+
+
+@pytest.fixture
+def mixed_pattern():
+    """Pattern covering every Beat field."""
+    return Pattern(
+        "mixed",
+        beats=[
+            Beat(0.0, DrumInstrument.KICK, 110),
+            Beat(1.0, DrumInstrument.SNARE, 120, accent=True),
+            Beat(1.5, DrumInstrument.SNARE, 40, ghost_note=True),
+            Beat(2.25, DrumInstrument.OPEN_HH_MAX, 90, duration=0.5),
+            Beat(3.0, DrumInstrument.CLOSED_HH_EDGE, 70),
+        ],
+    )
+
+
+class TestBeatArrays:
+    """Test the columnar beat representation."""
+
+    def test_columns_match_beats(self, mixed_pattern):
+        """Test that each column mirrors the corresponding Beat field."""
+        arrays = mixed_pattern.arrays()
+
+        assert len(arrays) == len(mixed_pattern.beats)
+        assert arrays.positions.dtype == np.float64
+        assert arrays.positions.tolist() == [0.0, 1.0, 1.5, 2.25, 3.0]
+        assert arrays.instruments.tolist() == [
+            b.instrument.value for b in mixed_pattern.beats
+        ]
+        assert arrays.velocities.tolist() == [110, 120, 40, 90, 70]
+        assert arrays.ghost_notes.tolist() == [
+            False,
+            False,
+            True,
+            False,
+            False,
+        ]
+        assert arrays.accents.tolist() == [False, True, False, False, False]
+
+    def test_round_trip(self, mixed_pattern):
+        """Test that arrays convert back into equal beats."""
+        assert mixed_pattern.arrays().to_beats() == mixed_pattern.beats
+
+    def test_positional_rebuilds_follow_field_order(self):
+        """Test that to_beats and copy keep every Beat field in place."""
+        # One non-default value per field, so any reordering shows up
+        values = {
+            "position": 2.5,
+            "instrument": DrumInstrument.RIDE_BELL,
+            "velocity": 77,
+            "duration": 0.75,
+            "ghost_note": True,
+            "accent": False,
+        }
+        assert [f.name for f in fields(Beat)] == list(values)
+        pattern = Pattern("order", beats=[Beat(**values)])
+
+        for beat in (
+            pattern.arrays().to_beats()[0],
+            pattern.copy().beats[0],
+        ):
+            assert {f.name: getattr(beat, f.name) for f in fields(Beat)} == (
+                values
+            )
+
+    def test_empty_pattern(self):
+        """Test that an empty pattern yields empty arrays."""
+        arrays = BeatArrays.from_beats([])
+
+        assert len(arrays) == 0
+        assert arrays.to_beats() == []
+
+    def test_snapshot_is_independent(self, mixed_pattern):
+        """Test that editing the arrays leaves the pattern untouched."""
+        arrays = mixed_pattern.arrays()
+        arrays.velocities[:] = 1
+
+        assert mixed_pattern.beats[0].velocity == 110
+
+    def test_take_reorders_every_column(self, mixed_pattern):
+        """Test that take() selects the same beats from each column."""
+        arrays = mixed_pattern.arrays()
+
+        taken = arrays.take(np.array([4, 0, 2]))
+
+        assert taken.to_beats() == [
+            mixed_pattern.beats[4],
+            mixed_pattern.beats[0],
+            mixed_pattern.beats[2],
+        ]
+
+    def test_ticks_round_to_grid(self, mixed_pattern):
+        """Test that positions convert to exact integer ticks."""
+        arrays = mixed_pattern.arrays()
+        arrays.positions[1] += 1e-9
+
+        ticks = arrays.ticks()
+
+        assert ticks.dtype == np.int32
+        assert ticks.tolist() == [0, 960, 1440, 2160, 2880]
+        assert arrays.ticks(4).tolist() == [0, 4, 6, 9, 12]
+
+    def test_queries_match_pattern_methods(self, mixed_pattern):
+        """Test that array queries select the same beats as Pattern."""
+        arrays = mixed_pattern.arrays()
+        beats = mixed_pattern.beats
+
+        near = arrays.at_position(1.5, 0.6)
+        snares = arrays.of_instrument(DrumInstrument.SNARE)
+
+        assert [beats[i] for i in near] == mixed_pattern.get_beats_at_position(
+            1.5, 0.6
+        )
+        assert [beats[i] for i in snares] == (
+            mixed_pattern.get_beats_by_instrument(DrumInstrument.SNARE)
+        )
+        assert arrays.duration_bars() == mixed_pattern.duration_bars()
+        assert BeatArrays.from_beats([]).duration_bars() == 1.0
+
+
+class TestPatternQueries:
+    """Test beat lookups on patterns."""
+
+    def test_add_beats_matches_add_beat(self):
+        """Test that bulk adds produce the same beats as single adds."""
+        bulk = Pattern("bulk").add_beats(
+            np.arange(4) * 0.5, DrumInstrument.CLOSED_HH, [80, 60, 80, 60]
+        )
+        single = Pattern("single")
+        for i, velocity in enumerate([80, 60, 80, 60]):
+            single.add_beat(i * 0.5, DrumInstrument.CLOSED_HH, velocity)
+
+        assert bulk.beats == single.beats
+        assert all(type(b.velocity) is int for b in bulk.beats)
+
+    def test_builder_hihats_matches_hihat(self):
+        """Test bulk hi-hats with per-hit velocities and open flags."""
+        opens = [False, True, False, True]
+        bulk = PatternBuilder("bulk").hihats(
+            np.arange(4) * 0.5, [80, 90, 80, 90], np.array(opens)
+        )
+        single = PatternBuilder("single")
+        for i, is_open in enumerate(opens):
+            single.hihat(i * 0.5, 90 if is_open else 80, open=is_open)
+
+        assert bulk.build().beats == single.build().beats
+
+    def test_builder_hihats_accepts_lazy_open_flags(self):
+        """Test that a generator of open flags is read flag by flag."""
+        pattern = (
+            PatternBuilder("lazy")
+            .hihats([0, 0.5, 1], 80, (o for o in [False, False, True]))
+            .build()
+        )
+
+        assert [b.instrument for b in pattern.beats] == [
+            DrumInstrument.CLOSED_HH,
+            DrumInstrument.CLOSED_HH,
+            DrumInstrument.OPEN_HH,
+        ]
+        with pytest.raises(ValueError, match="instruments"):
+            PatternBuilder("short").hihats([0, 0.5], open=[True])
+
+    def test_add_beats_accepts_generators(self):
+        """Test that lazy iterables work for positions and velocities."""
+        pattern = Pattern("lazy").add_beats(
+            (i * 0.5 for i in range(3)),
+            DrumInstrument.KICK,
+            (v for v in [90, 100, 110]),
+        )
+
+        assert [(b.position, b.velocity) for b in pattern.beats] == [
+            (0.0, 90),
+            (0.5, 100),
+            (1.0, 110),
+        ]
+
+    def test_add_beats_rejects_invalid_values_atomically(self):
+        """Test that invalid bulk input leaves the pattern unchanged."""
+        pattern = Pattern("bulk")
+
+        with pytest.raises(ValueError, match="Velocity"):
+            pattern.add_beats([0.0, 1.0], DrumInstrument.KICK, [100, 200])
+        with pytest.raises(ValueError, match="Position"):
+            pattern.add_beats([0.0, -1.0], DrumInstrument.KICK)
+        with pytest.raises(ValueError, match="instruments"):
+            pattern.add_beats([0.0, 1.0], [DrumInstrument.KICK])
+        with pytest.raises(ValueError, match="velocities"):
+            pattern.add_beats([0.0, 1.0], DrumInstrument.KICK, [100])
+        with pytest.raises(ValueError, match="one-dimensional"):
+            pattern.add_beats([[0.0, 1.0]], DrumInstrument.KICK)
+        with pytest.raises(ValueError, match="flat sequence"):
+            pattern.add_beats([0.0, [1.0]], DrumInstrument.KICK)
+
+        assert pattern.beats == []
+
+    def test_bulk_position_lookup_matches_single(self, mixed_pattern):
+        """Test that bulk lookups agree with per-position lookups."""
+        queries = [0.0, 1.0, 1.25, 1.4, 3.0, 5.0]
+
+        results = mixed_pattern.get_beats_at_positions(queries, 0.3)
+
+        assert results == [
+            mixed_pattern.get_beats_at_position(q, 0.3) for q in queries
+        ]
+        assert results[2] == mixed_pattern.beats[1:3]
+        assert results[-1] == []
+
+
+class TestPatternHumanize:
+    """Test simple pattern humanization."""
+
+    def test_offsets_stay_within_bounds(self, mixed_pattern):
+        """Test that timing and velocity stay within variance and range."""
+        humanized = mixed_pattern.humanize(0.02, 10)
+
+        assert humanized.name == "mixed_humanized"
+        assert humanized.metadata["humanized"] is True
+        for original, beat in zip(
+            mixed_pattern.beats, humanized.beats, strict=True
+        ):
+            assert beat.instrument == original.instrument
+            assert beat.ghost_note == original.ghost_note
+            assert beat.accent == original.accent
+            assert beat.duration == original.duration
+            assert beat.position >= 0.0
+            assert abs(beat.position - original.position) <= 0.02 + 1e-9
+            assert 1 <= beat.velocity <= 127
+            assert abs(beat.velocity - original.velocity) <= 10
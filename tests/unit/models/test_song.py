@@ -0,0 +1,324 @@
+"""Unit tests for song structure models."""
+
+import pickle
+import random
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from midi_drums.core.engine import DrumGenerator
+from midi_drums.models.pattern import Beat, DrumInstrument, Pattern
+from midi_drums.models.song import (
+    Fill,
+    GenerationParameters,
+    PatternVariation,
+    Section,
+    Song,
+)
+
+
+@pytest.fixture
+def section_with_fills():
+    """Eight-bar section with two fills."""
+    groove = Pattern("groove", beats=[Beat(0.0, DrumInstrument.KICK, 100)])
+    fills = [
+        Fill(Pattern("fill_a", beats=[Beat(0.0, DrumInstrument.SNARE, 110)])),
+        Fill(Pattern("fill_b", beats=[Beat(0.0, DrumInstrument.MID_TOM, 110)])),
+    ]
+    return Section("verse", groove, bars=8, fills=fills)
+
+
+class TestFillSchedule:
+    """Test up-front fill decisions for a section."""
+
+    def test_every_bar_at_full_frequency(self, section_with_fills):
+        """Test that a frequency of 1.0 schedules a fill on every bar."""
+        schedule = section_with_fills.fill_schedule(1.0)
+
+        assert sorted(schedule) == list(range(8))
+        assert all(
+            fill in section_with_fills.fills for fill in schedule.values()
+        )
+
+    def test_restricted_to_requested_bars(self, section_with_fills):
+        """Test that only the requested bars are decided."""
+        schedule = section_with_fills.fill_schedule(1.0, (7,))
+
+        assert list(schedule) == [7]
+
+    def test_zero_weight_fill_never_chosen(self, section_with_fills):
+        """Test that fills with no trigger probability are skipped."""
+        fills = section_with_fills.fills
+        fills[0] = replace(fills[0], trigger_probability=0.0)
+
+        schedule = section_with_fills.fill_schedule(1.0)
+
+        assert {fill.pattern.name for fill in schedule.values()} == {"fill_b"}
+
+    @pytest.mark.parametrize(
+        "make_rng", [np.random.default_rng, random.Random], ids=["numpy", "std"]
+    )
+    def test_seeded_rng_reproducible(self, section_with_fills, make_rng):
+        """Test that a passed generator makes the schedule repeatable."""
+        first = section_with_fills.fill_schedule(0.5, rng=make_rng(7))
+        second = section_with_fills.fill_schedule(0.5, rng=make_rng(7))
+
+        fill = section_with_fills.should_add_fill(3, 1.0, rng=make_rng(7))
+        assert first == second
+        assert fill in section_with_fills.fills
+
+    def test_select_fills_without_replacement(self, section_with_fills):
+        """Test picking several distinct fills by weight."""
+        section_with_fills.fills.append(
+            Fill(Pattern("never"), trigger_probability=0.0)
+        )
+
+        chosen = section_with_fills.select_fills(5)
+
+        assert sorted(fill.pattern.name for fill in chosen) == [
+            "fill_a",
+            "fill_b",
+        ]
+        assert section_with_fills.select_fills(0) == []
+
+    def test_select_fills_follows_weights(self, section_with_fills):
+        """Test that single picks are proportional to trigger probability."""
+        fills = section_with_fills.fills
+        fills[0] = replace(fills[0], trigger_probability=3.0)
+        rng = np.random.default_rng(0)
+
+        picks = [
+            section_with_fills.select_fills(1, rng)[0].pattern.name
+            for _ in range(4000)
+        ]
+
+        assert picks.count("fill_a") / len(picks) == pytest.approx(
+            0.75, abs=0.03
+        )
+
+    def test_fill_arrays(self, section_with_fills):
+        """Test the columnar view of a section's fills."""
+        fills = section_with_fills.fills
+        fills[0] = replace(fills[0], section_position="start")
+        fills[1] = replace(fills[1], trigger_probability=0.5)
+
+        arrays = section_with_fills.fill_arrays()
+
+        assert len(arrays) == 2
+        assert arrays.probabilities.tolist() == [1.0, 0.5]
+        assert arrays.at_position("start").tolist() == [0]
+        assert arrays.at_position("end").tolist() == [1]
+
+    def test_fills_are_interned_values(self, section_with_fills):
+        """Test that fills are frozen, hashable and can be shared."""
+        pattern = section_with_fills.pattern
+
+        fill = Fill.intern(pattern, 0.5)
+
+        assert Fill.intern(pattern, 0.5) is fill
+        assert Fill.intern(pattern, 0.6) is not fill
+        assert len({fill, Fill(pattern, 0.5)}) == 1
+        with pytest.raises(AttributeError):
+            fill.trigger_probability = 1.0
+
+    def test_fills_hash_on_pattern_identity(self, section_with_fills):
+        """Test that renaming a pattern keeps its fills' hashes stable."""
+        pattern = section_with_fills.pattern
+        fill = Fill(pattern, 0.5)
+        variation = PatternVariation(pattern, bars=[1, 2])
+        fills, variations = {fill}, {variation}
+
+        pattern.name = "renamed"
+
+        assert fill in fills
+        assert variation in variations
+        assert PatternVariation(pattern, bars=[1, 2]) == variation
+        assert Fill(pattern.copy(), 0.5) != fill
+
+    def test_no_fills(self, section_with_fills):
+        """Test empty schedules without fills or at zero frequency."""
+        assert section_with_fills.fill_schedule(0.0) == {}
+
+        section_with_fills.fills.clear()
+        assert section_with_fills.fill_schedule(1.0) == {}
+        assert section_with_fills.should_add_fill(0, 1.0) is None
+
+
+class TestPatternSchedule:
+    """Test up-front variation decisions for a section."""
+
+    def test_no_variations_uses_base_pattern(self, section_with_fills):
+        """Test that every bar plays the base pattern without variations."""
+        schedule = section_with_fills.pattern_schedule()
+
+        assert list(schedule) == list(range(8))
+        assert all(p is section_with_fills.pattern for p in schedule.values())
+
+    def test_certain_and_bar_specific_variations(self, section_with_fills):
+        """Test variation order, certainty and bar restrictions."""
+        never = Pattern("never")
+        always = Pattern("always")
+        bar_two = Pattern("bar_two")
+        section_with_fills.variations = [
+            PatternVariation(bar_two, probability=1.0, bars=[2]),
+            PatternVariation(never, probability=0.0),
+            PatternVariation(always, probability=1.0),
+        ]
+
+        schedule = section_with_fills.pattern_schedule()
+
+        assert schedule[2] is bar_two
+        assert all(schedule[bar] is always for bar in range(8) if bar != 2)
+        assert section_with_fills.get_effective_pattern(5) is always
+
+    def test_bar_decisions_match_probabilities(self, section_with_fills):
+        """Test batched decisions against the sequential odds."""
+        section_with_fills.bars = 20000
+        section_with_fills.variations = [
+            PatternVariation(Pattern("first"), probability=0.5),
+            PatternVariation(Pattern("second"), probability=0.5),
+        ]
+
+        variation_ids, fill_mask = section_with_fills.bar_decisions(
+            fill_frequency=0.25, rng=np.random.default_rng(0)
+        )
+
+        shares = np.bincount(variation_ids + 1) / len(variation_ids)
+        assert shares == pytest.approx([0.25, 0.5, 0.25], abs=0.02)
+        assert fill_mask.mean() == pytest.approx(0.25, abs=0.02)
+
+
+class TestSongTotals:
+    """Test cached song totals."""
+
+    def test_totals_follow_edits(self, section_with_fills):
+        """Test that add_section extends the caches in place."""
+        song = Song("totals", tempo=120).add_section(section_with_fills)
+        assert song.total_bars() == 8
+        assert song.total_duration_seconds() == 16.0
+        assert song.get_section_by_name("chorus") is None
+
+        song.add_section(Section("chorus", section_with_fills.pattern, 4))
+        assert song._total_bars_cache[1] == 12
+        assert song.total_bars() == 12
+        assert song.get_section_by_name("chorus") is song.sections[1]
+
+    def test_totals_follow_same_length_edits(self, section_with_fills):
+        """Test that in-place edits are seen without invalidate_cache."""
+        pattern = section_with_fills.pattern
+        song = Song("edits").add_section(section_with_fills)
+        song.add_section(Section("chorus", pattern, 4))
+        assert song.total_bars() == 12
+        assert song.get_section_by_name("chorus") is song.sections[1]
+
+        song.sections[1].bars = 2
+        assert song.total_bars() == 10
+        assert song.total_duration_seconds() == 20.0
+
+        song.sections[1] = Section("bridge", pattern, 1)
+        assert song.total_bars() == 9
+        assert song.get_section_by_name("chorus") is None
+        assert song.get_section_by_name("bridge") is song.sections[1]
+
+        song.sections = [Section("solo", pattern, 3), song.sections[0]]
+        assert song.total_bars() == 11
+        assert song.get_sections_by_name("bridge") == []
+
+        song.sections[0].name = "outro"
+        assert song.get_section_by_name("outro") is song.sections[0]
+
+    def test_duration_follows_tempo(self, section_with_fills):
+        """Test the cached beat length after set_tempo and assignment."""
+        song = Song("tempo", tempo=120).add_section(section_with_fills)
+
+        assert song.set_tempo(240).total_duration_seconds() == 8.0
+        song.tempo = 60
+        assert song.seconds_per_beat() == 1.0
+        assert song.total_duration_seconds() == 32.0
+        with pytest.raises(ValueError, match="Tempo"):
+            song.set_tempo(400)
+
+
+class TestGenerationParameters:
+    """Test generation parameter validation."""
+
+    @pytest.mark.parametrize(
+        "field_name", ["complexity", "swing_ratio", "context_blend"]
+    )
+    @pytest.mark.parametrize("value", [-0.1, 1.5, float("nan")])
+    def test_out_of_range_rejected(self, field_name, value):
+        """Test that the offending parameter is named in the error."""
+        with pytest.raises(ValueError, match=field_name):
+            GenerationParameters("rock", **{field_name: value})
+
+    def test_bounds_accepted(self):
+        """Test that 0.0 and 1.0 are valid."""
+        params = GenerationParameters("rock", complexity=0.0, dynamics=1.0)
+
+        assert params.complexity == 0.0
+        assert params.dynamics == 1.0
+
+    def test_interned_instances_shared(self):
+        """Test that identical parameter sets share one frozen instance."""
+        params = GenerationParameters.interned("rock", complexity=0.7)
+
+        assert GenerationParameters.interned("rock", complexity=0.7) is params
+        assert GenerationParameters.interned("rock") is not params
+        assert GenerationParameters.interned(
+            "rock", custom_parameters={"ghost_notes": True}
+        ).custom_parameters == {"ghost_notes": True}
+        with pytest.raises(AttributeError):
+            params.complexity = 0.1
+        with pytest.raises(TypeError):
+            params.custom_parameters["ghost_notes"] = True
+
+    def test_unhashable_custom_parameters_not_cached(self):
+        """Test that list-valued custom parameters still build parameters."""
+        custom = {"fills": [1, 2]}
+
+        params = GenerationParameters.interned("rock", custom_parameters=custom)
+
+        assert params.custom_parameters == custom
+        assert params.custom_parameters is not custom
+        assert (
+            GenerationParameters.interned("rock", custom_parameters=custom)
+            is not params
+        )
+
+    def test_generate_pattern_accepts_list_custom_parameter(self):
+        """Test generating through the engine with a list-valued parameter."""
+        pattern = DrumGenerator().generate_pattern(
+            "rock",
+            "verse",
+            style="classic",
+            custom_parameters={"fills": [1, 2]},
+        )
+
+        assert pattern is not None
+
+    def test_default_parameters_are_interned(self):
+        """Test that parameter sets without custom values are shared."""
+        first = Song.create_simple_structure("a", genre="metal")
+        second = Song.create_simple_structure("b", genre="metal")
+
+        assert first.global_parameters is second.global_parameters
+        assert first.global_parameters is GenerationParameters.interned("metal")
+
+
+class TestSectionLookup:
+    """Test finding song sections by name."""
+
+    def test_section_lookup_by_name(self):
+        """Test name lookups, including sections appended directly."""
+        song = Song.create_simple_structure("lookup")
+
+        choruses = song.get_sections_by_name("chorus")
+        assert [s.bars for s in choruses] == [8, 8, 8]
+        assert song.get_section_by_name("intro") is song.sections[0]
+        assert song.get_section_by_name("solo") is None
+
+        choruses.clear()
+        song.sections.append(Section("solo", song.sections[0].pattern, 2))
+        assert song.get_section_by_name("solo") is song.sections[-1]
+        assert len(song.get_sections_by_name("chorus")) == 3
@@ -10,13 +10,16 @@ This test suite validates the drummer modification system including:
 from midi_drums.config import TIMING, VELOCITY
 from midi_drums.models.pattern import DrumInstrument, Pattern, PatternBuilder
 from midi_drums.modifications import (
+    MODIFICATIONS_BY_NAME,
     BehindBeatTiming,
+    ColumnarModification,
     FastChopsTriplets,
     GhostNoteLayer,
     HeavyAccents,
     LinearCoordination,
     MechanicalPrecision,
     MinimalCreativity,
+    ModificationPipeline,
     ModificationRegistry,
     PocketStretching,
     ShuffleFeelApplication,
@@ -148,6 +151,20 @@ def test_ghost_note_layer():
     ghost_added = modified_ghost_count - original_ghost_count
     print(f"  [OK] GhostNoteLayer: added {ghost_added} ghost notes")
 
+    # At full density every 16th without a main snare gets a ghost note
+    full = GhostNoteLayer(density=1.0).apply(pattern, intensity=1.0)
+    ghost_positions = [b.position for b in full.beats if b.ghost_note]
+    assert ghost_positions == [
+        i * 0.25 for i in range(16) if i * 0.25 not in (1.0, 3.0)
+    ], "Ghost notes should fill every open 16th"
+
+    # Main snares pushed slightly off the grid still block their 16th
+    behind = BehindBeatTiming().apply(pattern, intensity=1.0)
+    full = GhostNoteLayer(density=1.0).apply(behind, intensity=1.0)
+    assert not any(
+        b.ghost_note and b.position in (1.0, 3.0) for b in full.beats
+    )
+
 
 def test_linear_coordination():
     """Test LinearCoordination modification."""
@@ -476,6 +493,11 @@ def test_modification_registry():
     assert mod is not None, "Failed to create modification from registry"
     assert isinstance(mod, BehindBeatTiming), "Wrong modification type created"
 
+    # Lookup table agrees with each class's own name
+    for name, mod_class in MODIFICATIONS_BY_NAME.items():
+        assert mod_class.name == name, f"{name} maps to {mod_class}"
+        assert registry.get(name) is mod_class
+
     print(
         f"  [OK] ModificationRegistry: {len(all_mods)} modifications registered"
     )
@@ -562,6 +584,127 @@ def test_immutability():
     print("  [OK] Immutability: original pattern unchanged after modifications")
 
 
+def test_seeded_rng_reproducible():
+    """Test that a seeded generator makes stochastic modifications repeat."""
+    import numpy as np
+
+    pattern = create_basic_pattern()
+
+    for mod_class in (
+        GhostNoteLayer,
+        LinearCoordination,
+        MinimalCreativity,
+        PocketStretching,
+        TripletVocabulary,
+        TwistedAccents,
+    ):
+        first = mod_class(rng=np.random.default_rng(42)).apply(pattern, 0.5)
+        second = mod_class(rng=np.random.default_rng(42)).apply(pattern, 0.5)
+        assert first.beats == second.beats, f"{mod_class.__name__} differs"
+
+    print("  [OK] Seeded rng: stochastic modifications are reproducible")
+
+
+def test_array_kernels():
+    """Test the shared array kernels against scalar arithmetic."""
+    import numpy as np
+
+    from midi_drums.modifications import _kernels
+
+    positions = np.array([0.06, 0.5, 1.19])
+    _kernels.quantize_blend(positions, 0.125, 0.5)
+    assert np.allclose(positions, [0.03, 0.5, 0.595 + 0.625])
+
+    velocities = np.array([100, 50, 101], dtype=np.int16)
+    blended = _kernels.blend_velocities(velocities, np.array([110] * 3), 0.5)
+    assert blended.dtype == np.int16
+    assert blended.tolist() == [105, 80, 105]
+
+    contrasted = _kernels.accent_contrast(
+        velocities,
+        accents=np.array([True, False, False]),
+        ghost_notes=np.array([True, True, False]),
+        boost=30,
+        cut=40,
+    )
+    assert contrasted.tolist() == [127, 20, 101]
+
+    print("  [OK] Array kernels: quantize, blend and contrast")
+
+
+def test_modification_pipeline():
+    """Test that a pipeline matches applying its steps one by one."""
+    import numpy as np
+
+    pattern = create_basic_pattern()
+    original_beats = list(pattern.beats)
+
+    def steps():
+        rng = np.random.default_rng(3)
+        return [
+            (HeavyAccents(), 0.9),
+            (BehindBeatTiming(), 0.7),
+            (TripletVocabulary(triplet_probability=1.0, rng=rng), 1.0),
+            (ShuffleFeelApplication(), 0.8),
+            (TwistedAccents(rng=rng), 0.6),
+            (SpeedPrecision(), 0.9),
+            (MechanicalPrecision(), 1.0),
+        ]
+
+    expected = pattern
+    for mod, intensity in steps():
+        expected = mod.apply(expected, intensity)
+
+    piped = ModificationPipeline(steps()).apply(pattern)
+
+    assert piped == expected
+    assert piped.name == (
+        "basic_test_heavy_accents_behind_beat_triplets"
+        "_shuffle_twisted_precision_mechanical"
+    )
+    assert pattern.beats == original_beats, "Input pattern changed"
+
+    # An empty pipeline still returns a new pattern
+    unchanged = ModificationPipeline([]).apply(pattern)
+    assert unchanged == pattern
+    assert unchanged is not pattern
+
+    # Columnar subclasses must implement both hooks
+    class Incomplete(ColumnarModification):
+        name = "incomplete"
+
+        def _apply_columns(self, beats, intensity):
+            pass
+
+    try:
+        Incomplete()
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("Missing _with_beats should be rejected")
+
+    print("  [OK] Pipeline: fused steps match sequential application")
+
+
+def test_lazy_package_exports():
+    """Test that every exported modification resolves lazily."""
+    import midi_drums.modifications as modifications
+    from midi_drums.modifications import drummer_mods
+
+    for name in modifications.__all__:
+        assert getattr(modifications, name) is getattr(drummer_mods, name)
+        assert name in dir(modifications)
+
+    try:
+        modifications.NotAModification  # noqa: B018
+    except AttributeError:
+        pass
+    else:
+        raise AssertionError("Unknown names should raise AttributeError")
+
+    print("  [OK] Lazy exports: all modifications resolve on access")
+
+
 if __name__ == "__main__":
     print("=" * 60)
     print("Drummer Modification System Tests")
@@ -583,6 +726,10 @@ if __name__ == "__main__":
     test_modification_registry()
     test_intensity_parameter()
     test_immutability()
+    test_seeded_rng_reproducible()
+    test_array_kernels()
+    test_modification_pipeline()
+    test_lazy_package_exports()
 
     print("=" * 60)
     print("All drummer modification tests passed!")
@@ -7,7 +7,7 @@ This test suite validates the pattern template system including:
 - Integration with existing pattern system
 """
 
-from midi_drums.config import TIMING
+from midi_drums.config import TIMING, VELOCITY
 from midi_drums.models.pattern import DrumInstrument
 from midi_drums.patterns import (
     BasicGroove,
@@ -59,6 +59,25 @@ def test_basic_groove_template():
     )
 
 
+def test_basic_groove_open_hihat():
+    """Test BasicGroove open hi-hats across bars."""
+    template = BasicGroove(use_open_hihat=True, open_hihat_positions=[3.5, 7.5])
+
+    pattern = TemplateComposer("open_hihat").add(template).build(bars=2)
+
+    open_hits = [
+        b for b in pattern.beats if b.instrument == DrumInstrument.OPEN_HH
+    ]
+    closed_count = sum(
+        1 for b in pattern.beats if b.instrument == DrumInstrument.CLOSED_HH
+    )
+    assert [b.position for b in open_hits] == [3.5, 7.5]
+    assert all(b.velocity == VELOCITY.HIHAT_OPEN for b in open_hits)
+    assert closed_count == 14, f"Expected 14 closed hihats, got {closed_count}"
+
+    print("  [OK] BasicGroove: open hihats on 3.5 and 7.5")
+
+
 def test_double_bass_template():
     """Test DoubleBassPedal template."""
     print("Testing DoubleBassPedal template...")
@@ -348,6 +367,7 @@ if __name__ == "__main__":
     print("=" * 60)
 
     test_basic_groove_template()
+    test_basic_groove_open_hihat()
     test_double_bass_template()
     test_blast_beat_template()
     test_jazz_ride_template()
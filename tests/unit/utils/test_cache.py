@@ -0,0 +1,29 @@
+"""Tests for the bounded cache helper."""
+
+from midi_drums.utils.cache import get_or_create
+
+
+class TestGetOrCreate:
+    """Test suite for get_or_create."""
+
+    def test_builds_once_per_key(self):
+        """Test that a hit returns the stored value without rebuilding."""
+        cache = {}
+        calls = []
+
+        def factory():
+            calls.append(1)
+            return object()
+
+        first = get_or_create(cache, "a", factory, limit=4)
+
+        assert get_or_create(cache, "a", factory, limit=4) is first
+        assert len(calls) == 1
+
+    def test_evicts_oldest_when_full(self):
+        """Test that the first inserted entry is dropped at the limit."""
+        cache = {}
+        for key in "abc":
+            get_or_create(cache, key, key.upper, limit=2)
+
+        assert cache == {"b": "B", "c": "C"}